@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import sysconfig
+
+# imports sysutil in a fresh interpreter and fails if any module outside the standard library gets loaded
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+
+PROBE = '''
+import sys, time
+before = set(sys.modules)
+started = time.perf_counter()
+import sysutil
+elapsed = time.perf_counter() - started
+print(elapsed)
+for name in sorted(set(sys.modules) - before):
+    module = sys.modules[name]
+    print(name, getattr(module, '__file__', None) or '')
+'''
+
+def isStandardLibrary(name, path):
+    if not path or name in sys.builtin_module_names:
+        return True
+
+    if name == 'sysutil':
+        return True
+
+    path = os.path.realpath(path)
+    paths = sysconfig.get_paths()
+
+    for key in ('stdlib', 'platstdlib'):
+        root = os.path.realpath(paths[key])
+
+        if path.startswith(root + os.sep) and 'site-packages' not in path[len(root):]:
+            return True
+
+    return False
+
+def main():
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=SOURCE_DIR,
+        capture_output=True,
+        text=True
+    )
+
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        return 1
+
+    lines = result.stdout.strip().split('\n')
+    elapsed = float(lines[0])
+
+    foreign = []
+    for line in lines[1:]:
+        name, _, path = line.partition(' ')
+
+        if not isStandardLibrary(name, path):
+            foreign.append(f'{name} ({path})')
+
+    print(f'import sysutil: {elapsed * 1000:.1f} ms, {len(lines) - 1} modules loaded')
+
+    if foreign:
+        print('non standard library modules loaded at import time:', file=sys.stderr)
+
+        for module in foreign:
+            print(f'  {module}', file=sys.stderr)
+
+        return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
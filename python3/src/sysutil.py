@@ -1,9 +1,19 @@
+import abc
+import array
 import dataclasses
+import operator
 import os
 import sys
 import time
 
-from dbus.service import Interface
+# result records are slotted on interpreters which support it (Python 3.10+)
+__RECORD_OPTIONS = {'slots' : True} if sys.version_info >= (3, 10) else {}
+
+def __record(cls=None, *, frozen=False):
+    def wrap(cls):
+        return dataclasses.dataclass(cls, frozen=frozen, **__RECORD_OPTIONS)
+
+    return wrap if cls is None else wrap(cls)
 
 
 class BatteryStatus:
@@ -11,12 +21,35 @@ class BatteryStatus:
     Discharging = 'discharging'
     Full = 'full'
 
-@dataclasses.dataclass
+@__record
 class Battery:
     capacity: int
     status: str
 
-@dataclasses.dataclass
+@__record
+class PowerSupply:
+    name: str
+    supplyType: str
+    online: bool
+    status: str
+    capacity: int
+    energyNow: float
+    energyFull: float
+    chargeNow: float
+    chargeFull: float
+    voltage: float
+    power: float
+
+@__record
+class PowerSupplyEstimate:
+    name: str
+    status: str
+    power: float
+    timeToEmpty: float
+    timeToFull: float
+    interval: float
+
+@__record
 class ProcessorUsage:
     total: float
     user: float
@@ -27,22 +60,114 @@ class ProcessorUsage:
     interrupt: float
     soft_interrupt: float
 
-@dataclasses.dataclass
+@__record
 class CpuUsage:
     average: ProcessorUsage
     processors: [ProcessorUsage]
 
-@dataclasses.dataclass
+@__record
+class ProcStat:
+    processors: int
+    fields: int
+    counters: array.array
+    contextSwitches: int
+    interrupts: int
+    softInterrupts: int
+    processesCreated: int
+    processesRunning: int
+    processesBlocked: int
+    timestamp: float
+
+@__record
+class SystemActivity:
+    usage: CpuUsage
+    contextSwitches: float
+    interrupts: float
+    softInterrupts: float
+    processesCreated: float
+    processesRunning: int
+    processesBlocked: int
+    interval: float
+
+@__record
+class InterruptRates:
+    cpus: tuple
+    labels: tuple
+    descriptions: tuple
+    rates: array.array
+
+    def perProcessor(self, label):
+        row = self.labels.index(label)
+        width = len(self.cpus)
+
+        return self.rates[row * width:(row + 1) * width]
+
+    def total(self, label):
+        return sum(self.perProcessor(label))
+
+@__record
+class InterruptActivity:
+    interrupts: InterruptRates
+    softInterrupts: InterruptRates
+    interval: float
+
+@__record
 class NetworkRate:
     download: float
     upload: float
 
-@dataclasses.dataclass
+@__record
 class TemperatureSensor:
     label: str
     temperature: float
 
-@dataclasses.dataclass
+@__record
+class TripPoint:
+    tripType: str
+    temperature: float
+    hysteresis: float
+
+@__record
+class ThermalZone:
+    name: str
+    zoneType: str
+    temperature: float
+    tripPoints: [TripPoint]
+
+@__record
+class CoolingDevice:
+    name: str
+    deviceType: str
+    state: int
+    maximumState: int
+
+@__record
+class ThrottleEvents:
+    cpu: int
+    core: int
+    package: int
+
+@__record
+class PowerZone:
+    zone: str
+    name: str
+    package: str
+    energy: float
+    watts: float
+
+@__record
+class PowerUsage:
+    zones: [PowerZone]
+    interval: float
+
+@__record
+class ThermalState:
+    zones: [ThermalZone]
+    coolingDevices: [CoolingDevice]
+    throttling: [ThrottleEvents]
+    interval: float
+
+@__record
 class CpuInfo:
     modelName: str
     cores: int
@@ -54,7 +179,7 @@ class CpuInfo:
     architecture: str
     byteOrder: str
 
-@dataclasses.dataclass
+@__record
 class SchedulerPolicy:
     name: str
     scalingGovernor: str
@@ -62,7 +187,7 @@ class SchedulerPolicy:
     minimumScalingMHz: float
     maximumScalingMHz: float
 
-@dataclasses.dataclass
+@__record(frozen=True)
 class Frequency:
     _khz: float
 
@@ -75,12 +200,11 @@ class Frequency:
     def ghz(self):
         return self._khz / 1000_000
 
-@dataclasses.dataclass
+@__record
 class ProcessorFrequency:
     processorID: str
     frequency: Frequency
 
-@dataclasses.dataclass
 class CPU:
     info: CpuInfo
     averageUsage: ProcessorUsage
@@ -89,32 +213,168 @@ class CPU:
     averageFrequency: Frequency
     perProcessorFrequency: [ProcessorFrequency]
 
-    def __init__(self):
-        self.info = cpuInfo()
+    # attribute groups which change over time, and can therefore be updated
+    __VOLATILE_GROUPS = ('usage', 'scheduler', 'frequency')
 
-        usage = cpuUsage()
-        self.averageUsage = usage.average
-        self.perProcessorUsage = usage.processors
+    # attributes of the former dataclass, compared by __eq__ and returned by asdict
+    __FIELDS = (
+        'info', 'averageUsage', 'perProcessorUsage', 'schedulerPolicies', 'averageFrequency', 'perProcessorFrequency'
+    )
+
+    def __init__(self, cadence=None):
+        # maximum age in seconds of each attribute group, groups not listed are never refreshed on access
+        self.cadence = dict(cadence) if cadence else {}
+        self.__groups = {}
+        self.__statSampler = None
+
+    def __usage(self):
+        if self.__statSampler is None:
+            self.__statSampler = StatSampler()
+            time.sleep(0.25)
+
+        return self.__statSampler.update().usage
+
+    def __group(self, name, collector):
+        if (cached := self.__groups.get(name)) is not None:
+            timestamp, value = cached
+            maxAge = self.cadence.get(name)
+
+            if maxAge is None or time.monotonic() - timestamp < maxAge:
+                return value
+
+        value = collector()
+        self.__groups[name] = (time.monotonic(), value)
+
+        return value
 
-        self.schedulerPolicies = schedulerInfo()
+    @property
+    def info(self):
+        return self.__group('info', cpuInfo)
 
-        frequency = cpuFrequency()
-        self.averageFrequency = frequency.average
-        self.perProcessorFrequency = cpuFrequency().processors
+    @property
+    def averageUsage(self):
+        return self.__group('usage', self.__usage).average
 
+    @property
+    def perProcessorUsage(self):
+        return self.__group('usage', self.__usage).processors
+
+    @property
+    def schedulerPolicies(self):
+        return self.__group('scheduler', schedulerInfo)
+
+    @property
+    def averageFrequency(self):
+        return self.__group('frequency', cpuFrequency).average
+
+    @property
+    def perProcessorFrequency(self):
+        return self.__group('frequency', cpuFrequency).processors
 
     def update(self):
-        usage = cpuUsage()
-        self.averageUsage = usage.average
-        self.perProcessorUsage = usage.processors
-        self.schedulerPolicies = schedulerInfo()
+        collectors = {
+            'usage' : self.__usage,
+            'scheduler' : schedulerInfo,
+            'frequency' : cpuFrequency
+        }
+
+        for name in self.__VOLATILE_GROUPS:
+            if name in self.__groups:
+                self.__groups[name] = (time.monotonic(), collectors[name]())
+
+    def asdict(self):
+        # same layout as dataclasses.asdict gave when CPU was a dataclass
+        values = {}
+
+        for name in self.__FIELDS:
+            value = getattr(self, name)
+
+            if isinstance(value, list):
+                values[name] = [dataclasses.asdict(item) for item in value]
+            else:
+                values[name] = dataclasses.asdict(value) if dataclasses.is_dataclass(value) else value
 
-@dataclasses.dataclass
+        return values
+
+    def __eq__(self, other):
+        if not isinstance(other, CPU):
+            return NotImplemented
+
+        return all(getattr(self, name) == getattr(other, name) for name in self.__FIELDS)
+
+    # mutable like the former dataclass, hence unhashable
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__FIELDS)
+        return f'CPU({fields})'
+
+@__record
 class RamSize:
     gb: float
     gib: float
 
-@dataclasses.dataclass
+@__record
+class VmStat:
+    pageFaults: int
+    majorPageFaults: int
+    pagesIn: int
+    pagesOut: int
+    swapIn: int
+    swapOut: int
+    pagesScanned: int
+    pagesReclaimed: int
+    allocationStalls: int
+    oomKills: int
+
+@__record
+class MemoryInfo:
+    total: int
+    free: int
+    available: int
+    buffers: int
+    cached: int
+    swapCached: int
+    active: int
+    inactive: int
+    activeAnon: int
+    inactiveAnon: int
+    activeFile: int
+    inactiveFile: int
+    unevictable: int
+    mlocked: int
+    swapTotal: int
+    swapFree: int
+    zswap: int
+    zswapped: int
+    dirty: int
+    writeback: int
+    anonPages: int
+    mapped: int
+    shmem: int
+    kernelReclaimable: int
+    slab: int
+    slabReclaimable: int
+    slabUnreclaimable: int
+    kernelStack: int
+    pageTables: int
+    commitLimit: int
+    committed: int
+    vmallocTotal: int
+    vmallocUsed: int
+    percpu: int
+    anonHugePages: int
+    shmemHugePages: int
+    fileHugePages: int
+    hugePagesTotal: int
+    hugePagesFree: int
+    hugePagesReserved: int
+    hugePagesSurplus: int
+    hugePageSize: int
+    hugetlb: int
+    vmstat: VmStat
+
+@__record
 class VramSize:
     gb: float
     gib: float
@@ -141,43 +401,24 @@ class RouteStatus:
 
     @staticmethod
     def fromTcpCode(code):
-        if code == '01':
-            return RouteStatus.ESTABLISHED
-
-        elif code == '02':
-            return RouteStatus.SYN_SENT
-
-        elif code == '03':
-            return RouteStatus.SYN_RECEIVED
-
-        elif code == '04':
-            return RouteStatus.FIN_WAIT1
-
-        elif code == '05':
-            return RouteStatus.FIN_WAIT2
-
-        elif code == '06':
-            return RouteStatus.TIME_WAIT
-
-        elif code == '07':
-            return RouteStatus.CLOSED
-
-        elif code == '08':
-            return RouteStatus.CLOSE_WAIT
-
-        elif code == '09':
-            return RouteStatus.LAST_ACKNOWLEDGEMENT
-
-        elif code == '0A':
-            return RouteStatus.LISTENING
-
-        elif code == '0B':
-            return RouteStatus.CLOSING
-
-        elif code == '0C':
-            return RouteStatus.NEW_SYN_RECEIVED
-
-@dataclasses.dataclass
+        return TCP_STATES.get(code)
+
+TCP_STATES = {
+    '01' : RouteStatus.ESTABLISHED,
+    '02' : RouteStatus.SYN_SENT,
+    '03' : RouteStatus.SYN_RECEIVED,
+    '04' : RouteStatus.FIN_WAIT1,
+    '05' : RouteStatus.FIN_WAIT2,
+    '06' : RouteStatus.TIME_WAIT,
+    '07' : RouteStatus.CLOSED,
+    '08' : RouteStatus.CLOSE_WAIT,
+    '09' : RouteStatus.LAST_ACKNOWLEDGEMENT,
+    '0A' : RouteStatus.LISTENING,
+    '0B' : RouteStatus.CLOSING,
+    '0C' : RouteStatus.NEW_SYN_RECEIVED
+}
+
+@__record
 class NetworkRoute:
     routeType: str
     localAddress: str
@@ -185,27 +426,63 @@ class NetworkRoute:
     remoteAddress: str
     remotePort: int
     routeStatus: str
-
-@dataclasses.dataclass
+    inode: int = 0
+    pid: int = None
+    command: str = None
+
+@__record
+class TcpStatistics:
+    activeOpens: int
+    passiveOpens: int
+    attemptFails: int
+    establishedResets: int
+    currentEstablished: int
+    inSegments: int
+    outSegments: int
+    retransmittedSegments: int
+    inErrors: int
+    outResets: int
+    timeouts: int
+    listenOverflows: int
+    listenDrops: int
+    socketsInUse: int
+    orphans: int
+    timeWait: int
+    allocated: int
+    memoryPages: int
+
+@__record
+class ConnectionSummary:
+    total: int
+    counts: dict
+    localPorts: dict
+
+    def byType(self, routeType):
+        return sum(self.counts.get(routeType, {}).values())
+
+    def byStatus(self, routeStatus):
+        return sum(statuses.get(routeStatus, 0) for statuses in self.counts.values())
+
+@__record
 class ClockSource:
     current: str
     available: [str]
 
-@dataclasses.dataclass
+@__record(frozen=True)
 class Bios:
     vendor: str
     release: str
     version: str
     date: str
 
-@dataclasses.dataclass
+@__record(frozen=True)
 class Motherboard:
     name: str
     vendor: str
     version: str
     bios: Bios
 
-@dataclasses.dataclass
+@__record
 class GpuMetrics:
     temperatureEdge: int
     temperatureHotspot: int
@@ -224,7 +501,7 @@ class GpuMetrics:
     pcieLinkWidth: int
     pcieLinkSpeed: int
 
-@dataclasses.dataclass
+@__record(frozen=True)
 class ByteSize:
     __bytes: int
 
@@ -255,7 +532,7 @@ class ByteSize:
     def tib(self):
         return self.__bytes / (1024 ** 4)
 
-@dataclasses.dataclass
+@__record
 class StoragePartition:
     device: str
     mountPoint: str
@@ -263,7 +540,7 @@ class StoragePartition:
     size: ByteSize
     startPoint: str
 
-@dataclasses.dataclass
+@__record
 class NvmeDevice:
     device: str
     pcieAddress: str
@@ -273,30 +550,152 @@ class NvmeDevice:
     size: ByteSize
     partitions: [StoragePartition]
 
-@dataclasses.dataclass
+@__record
 class StorageDevice:
     model: str
     device: str
     size: ByteSize
     partitions: [StoragePartition]
 
-@dataclasses.dataclass
+@__record
+class FilesystemUsage:
+    device: str
+    mountPoint: str
+    filesystem: str
+    size: ByteSize
+    free: ByteSize
+    available: ByteSize
+    used: ByteSize
+    files: int
+    freeFiles: int
+    stale: bool
+
+@__record
+class PolicyFrequency:
+    name: str
+    cpus: [int]
+    frequency: Frequency
+
+@__record
 class CpuFrequency:
     average: Frequency
     processors: [ProcessorFrequency]
+    policies: [PolicyFrequency] = dataclasses.field(default_factory=list)
+
+@__record(frozen=True)
+class CpuCore:
+    package: int
+    die: int
+    core: int
+    threads: [int]
+
+@__record(frozen=True)
+class CpuCache:
+    level: int
+    cacheType: str
+    size: ByteSize
+    lineSize: int
+    ways: int
+    sharedCpus: [int]
+
+@__record(frozen=True)
+class NumaNode:
+    id: int
+    cpus: [int]
+    distances: [int]
+
+@__record(frozen=True)
+class CpuTopology:
+    packages: int
+    dies: int
+    cores: [CpuCore]
+    threads: int
+    caches: [CpuCache]
+    nodes: [NumaNode]
 
-@dataclasses.dataclass
+@__record
 class Backlight:
     brightness: int
     maxBrightness: int
 
-@dataclasses.dataclass
+@__record
 class Load:
-    oneMinute: int
-    fiveMinutes: int
-    fifteenMinutes: int
+    oneMinute: float
+    fiveMinutes: float
+    fifteenMinutes: float
+
+@__record
+class PressureRecord:
+    avg10: float
+    avg60: float
+    avg300: float
+    total: int
+
+@__record
+class Pressure:
+    some: PressureRecord
+    full: PressureRecord
+
+@__record
+class SystemPressure:
+    cpu: Pressure
+    memory: Pressure
+    io: Pressure
+
+@__record
+class PressureStall:
+    some: float
+    full: float
+
+@__record
+class PressureRate:
+    cpu: PressureStall
+    memory: PressureStall
+    io: PressureStall
+    interval: float
+
+class AddressFamily:
+    IPV4 = 'ipv4'
+    IPV6 = 'ipv6'
+
+@__record
+class IPAddress:
+    address: str
+    interface: str
+    family: str
+    prefixLength: int
+    broadcast: str
+    scope: str
 
-@dataclasses.dataclass
+@__record
+class NetworkLink:
+    index: int
+    name: str
+    macAddress: str
+    mtu: int
+    operationalState: str
+    up: bool
+
+class NetworkEventType:
+    LINK_UPDATED = 'link updated'
+    LINK_REMOVED = 'link removed'
+    ADDRESS_ADDED = 'address added'
+    ADDRESS_REMOVED = 'address removed'
+
+@__record
+class NetworkEvent:
+    eventType: str
+    link: NetworkLink
+    address: IPAddress
+
+@__record
+class UEvent:
+    action: str
+    subsystem: str
+    devicePath: str
+    properties: dict
+
+@__record
 class IPv4:
     address: str
     interface: str
@@ -304,7 +703,7 @@ class IPv4:
     cidr: int
     netmask: str
 
-@dataclasses.dataclass
+@__record
 class BusInput:
     bus: int
     vendor: int
@@ -321,1002 +720,3464 @@ class BusInput:
     miscellaneousEvents: int
     led: int
 
+@__record
+class CollectorStats:
+    name: str
+    calls: int
+    errors: int
+    totalSeconds: float
+    histogram: dict
+    filesOpened: int
+    bytesRead: int
+    exceptionsSwallowed: int
+
 class InterfaceType:
     PHYSICAL = 'physical'
     VIRTUAL = 'virtual'
 
-@dataclasses.dataclass
+@__record
 class NetowrkInterface:
     name: str
     macAddress: str
     interfaceType: str
+    index: int = None
+    speed: int = None
+    duplex: str = None
+    mtu: int = None
+    operationalState: str = None
+    driver: str = None
+    master: str = None
+    rxQueues: int = None
+    txQueues: int = None
+
+@__record
+class InterfaceCounters:
+    rxBytes: int
+    rxPackets: int
+    rxErrors: int
+    rxDropped: int
+    rxFifo: int
+    rxFrame: int
+    rxCompressed: int
+    rxMulticast: int
+    txBytes: int
+    txPackets: int
+    txErrors: int
+    txDropped: int
+    txFifo: int
+    txCollisions: int
+    txCarrier: int
+    txCompressed: int
+
+# optional backends, imported on first use and never at import time
+__OPTIONAL_BACKENDS = ('numpy',)
+__loadedBackends = {}
+
+def __backend(name):
+    if name not in __loadedBackends:
+        try:
+            __loadedBackends[name] = __import__(name)
+
+        except ImportError:
+            __loadedBackends[name] = None
+
+    return __loadedBackends[name]
+
+def __getattr__(name):
+    # resolves `sysutil.<backend>` lazily, `None` when the backend is not installed
+    if name in __OPTIONAL_BACKENDS:
+        return __backend(name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 def __linuxCheck():
     if not os.path.exists('/sys') or not os.path.exists('/proc'):
         raise Exception('Detected non-Linux system')
 
-def __readFile(filePath):
-    try:
-        with open(filePath, 'r') as file:
-            return file.read()
+# results of coalesced collectors younger than this many seconds are shared with later callers
+__coalescingStaleness = 0.0
 
-    except:
-        return ''
+def setCoalescingStaleness(seconds):
+    global __coalescingStaleness
 
-def __batteryPath():
-    DRIVER_DIR = '/sys/class/power_supply'
-    batteries = []
+    if seconds < 0:
+        raise ValueError('staleness must not be negative')
 
-    for dir in os.listdir(DRIVER_DIR):
-        path = f'{DRIVER_DIR}/{dir}'
+    __coalescingStaleness = seconds
 
-        if 'type' not in os.listdir(path):
-            continue
+def __coalesced(function):
+    import functools
+    import threading
 
-        with open(f'{path}/type', 'r') as type:
-            if type != 'Battery':
-                continue
+    # flight: [done event, result, error] of the sample being taken, None when idle
+    state = {'flight' : None, 'result' : None, 'finished' : 0.0}
+    lock = threading.Lock()
 
-        if os.path.exists(f'{path}/status') and os.path.exists(f'{path}/capacity'):
-            batteries.append(path)
+    @functools.wraps(function)
+    def wrapper():
+        if state['result'] is not None and time.monotonic() - state['finished'] < __coalescingStaleness:
+            return state['result']
 
-    try:
-        battery = batteries[0]
+        with lock:
+            flight = state['flight']
+            leader = flight is None
 
-    except:
-        return None
+            if leader:
+                flight = state['flight'] = [threading.Event(), None, None]
 
-    return battery
+        if not leader:
+            # another thread is sampling already, its result is shared
+            flight[0].wait()
 
-def batteryInfo():
-    __linuxCheck()
+            if flight[2] is not None:
+                raise flight[2]
 
-    batteryPath = __batteryPath()
+            return flight[1]
 
-    if batteryPath is None:
-        return None
+        try:
+            flight[1] = function()
 
-    try:
-        with open(f'{batteryPath}/capacity', 'r') as file:
-            capacity = file.read().strip()
+            state['result'] = flight[1]
+            state['finished'] = time.monotonic()
 
-    except:
+            return flight[1]
+
+        except BaseException as error:
+            flight[2] = error
+            raise
+
+        finally:
+            with lock:
+                state['flight'] = None
+
+            flight[0].set()
+
+    return wrapper
+
+# thread local state of `collect`, created on its first call
+__snapshotState = None
+
+def __snapshotSources():
+    if __snapshotState is None:
         return None
 
-    else:
-        if not capacity:
-            return None
+    return getattr(__snapshotState, 'sources', None)
 
-    try:
-        capacity = int(capacity)
-    except:
-        capacity = None
+def __readFile(filePath):
+    sources = __snapshotSources()
+
+    if sources is not None and filePath in sources:
+        return sources[filePath]
 
     try:
-        with open(f'{batteryPath}/status', 'r') as file:
-            status = file.read().strip()
+        with open(filePath, 'r') as file:
+            content = file.read()
 
     except:
-        return None
+        content = ''
 
-    else:
-        if not status:
-            return None
+    if sources is not None:
+        sources[filePath] = content
 
-    if status == 'Charging':
-        status = BatteryStatus.Charging
+    return content
 
-    elif status == 'Discharging':
-        status = BatteryStatus.Discharging
+def __parsedFile(filePath, parser):
+    sources = __snapshotSources()
 
-    elif status == 'Full':
-        status = BatteryStatus.Full
+    if sources is None:
+        return parser(__readFile(filePath))
 
-    else:
-        status = None
+    # parsed values are shared too, callers must not modify them
+    key = (filePath, parser)
 
-    return Battery(
-        capacity=capacity,
-        status=status
-    )
+    if key not in sources:
+        sources[key] = parser(__readFile(filePath))
 
-def gpuUsage():
-    __linuxCheck()
+    return sources[key]
 
+def _readText(path):
+    # uncached read of a small sysfs attribute, shared by the samplers
     try:
-        with open('/sys/class/drm/card0/device/gpu_busy_percent', 'r') as file:
-            return float(file.read().strip())
-
+        with open(path, 'r') as file:
+            return file.read().strip()
     except:
-        return None
+        return ''
 
-def __getStats():
-    with open('/proc/stat', 'r') as file:
-        statFile = file.read()
+class _DescriptorSampler:
+    # keeps value files open and re-reads them with pread, subclasses open them through _open
+    __descriptors = ()
 
-    lines = statFile.split('\n')
-    intLines = []
+    def __init__(self):
+        self.__descriptors = []
 
-    for line in lines:
-        if 'cpu' not in line:
-            continue
+    def _open(self, path):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except:
+            return None
 
-        splittedLine = line.split(' ')
-        intLine = []
+        self.__descriptors.append(fd)
+        return fd
 
-        for chunk in splittedLine:
-            if chunk and 'cpu' not in chunk:
+    @staticmethod
+    def _value(fd):
+        if fd is None:
+            return None
 
-                intLine.append(int(chunk))
-        intLines.append(intLine)
+        try:
+            return int(os.pread(fd, 32, 0))
+        except:
+            return None
 
-    return intLines
+    def __enter__(self):
+        return self
 
-def cpuUsage():
-    __linuxCheck()
+    def __exit__(self, *args):
+        self.close()
 
-    before = __getStats()
-    time.sleep(0.25)
-    after = __getStats()
+    def __del__(self):
+        self.close()
 
-    processors = []
+    def close(self):
+        for fd in self.__descriptors:
+            try:
+                os.close(fd)
+            except:
+                pass
 
-    for i in range(len(before)):
-        beforeLine = before[i]
-        afterLine = after[i]
-
-        beforeSum = sum(beforeLine)
-        afterSum = sum(afterLine)
-
-        delta = afterSum - beforeSum
-        processors.append(
-            ProcessorUsage(
-                total=100 - (afterLine[3] - beforeLine[3]) * 100 / delta,
-                user=(afterLine[0] - beforeLine[0]) * 100 / delta,
-                nice=(afterLine[1] - beforeLine[1]) * 100 / delta,
-                system=(afterLine[2] - beforeLine[2]) * 100 / delta,
-                idle=(afterLine[3] - beforeLine[3]) * 100 / delta,
-                iowait=(afterLine[4] - beforeLine[4]) * 100 / delta,
-                interrupt=(afterLine[5] - beforeLine[5]) * 100 / delta,
-                soft_interrupt=(afterLine[6] - beforeLine[6]) * 100 / delta,
-            )
-        )
+        self.__descriptors = []
 
-    return CpuUsage(
-        average=processors[0],
-        processors=processors[1:]
-    )
+# discovery results are cached only while the hotplug monitor runs, group -> {key: value}
+__discoveryCache = {}
+__discoveryGenerations = {}
+__hotplugMonitor = None
 
-def ramUsage():
-    __linuxCheck()
+# uevent subsystem -> discovery cache group
+__HOTPLUG_GROUPS = {
+    'block' : 'block',
+    'nvme' : 'block',
+    'input' : 'input',
+    'net' : 'net',
+    'power_supply' : 'power_supply',
+    'drm' : 'drm'
+}
 
-    with open('/proc/meminfo', 'r') as file:
-        fileContent = file.read()
+def __discovered(group, key, discover):
+    if __hotplugMonitor is None:
+        return discover()
 
-    memTotal = 0
-    memAvailable = 0
+    cache = __discoveryCache.setdefault(group, {})
 
-    for element in fileContent.split('\n'):
-        if 'MemTotal' in element:
-            memTotal = int(element.split(' ')[-2])
+    if key in cache:
+        return cache[key]
 
-        elif 'MemAvailable' in element:
-            memAvailable = int(element.split(' ')[-2])
+    generation = __discoveryGenerations.get(group, 0)
+    value = discover()
 
-    return 100 - memAvailable * 100 / memTotal
+    # a value discovered while a matching event arrived may already be outdated
+    if __discoveryGenerations.get(group, 0) == generation:
+        cache[key] = value
 
-def __getRate():
-    with open('/proc/net/dev', 'r') as file:
-        stats = file.read()
+    return value
 
-    downloadRate = 0
-    uploadRate = 0
+def __invalidateDiscovery(event):
+    groups = __discoveryCache if event is None else (__HOTPLUG_GROUPS.get(event.subsystem),)
 
-    for line in stats.split('\n'):
-        if ':' in line:
+    if event is None or event.subsystem == 'net':
+        _invalidateInterfaces()
 
-            data = []
-            for chunk in line.split(' '):
-                if chunk and ':' not in chunk:
-                    data.append(chunk)
+    for group in list(groups):
+        if group is None:
+            continue
 
-            downloadRate += int(data[0])
-            uploadRate += int(data[8])
+        __discoveryGenerations[group] = __discoveryGenerations.get(group, 0) + 1
+        __discoveryCache.pop(group, None)
 
-    return downloadRate, uploadRate
+def __listDirectory(group, path):
+    return __discovered(group, ('listdir', path), lambda: os.listdir(path))
 
-def networkRate():
-    __linuxCheck()
+def __deviceAttribute(group, path):
+    return __discovered(group, ('attribute', path), lambda: __readFile(path))
 
-    downBefore, upBefore = __getRate()
-    time.sleep(0.5)
-    downAfter, upAfter = __getRate()
+def __powerSupplyNames():
+    try:
+        return sorted(os.listdir('/sys/class/power_supply'))
+    except:
+        return []
 
-    return NetworkRate (
-        download=(downAfter - downBefore) / 0.5,
-        upload=(upAfter - upBefore) / 0.5
-    )
+def __parsePowerSupply(name, content):
+    values = {}
 
-def temperatureSensors():
-    __linuxCheck()
+    for line in content.split('\n'):
+        key, equal, value = line.partition('=')
 
-    DRIVER_DIR = '/sys/class/hwmon'
-    sensorsDirectories = os.listdir(DRIVER_DIR)
+        if equal and key.startswith('POWER_SUPPLY_'):
+            values[key[13:]] = value
 
-    sensors = []
-    for directory in sensorsDirectories:
-        with open(f'{DRIVER_DIR}/{directory}/name', 'r') as labelFile:
-            label = labelFile.read().strip()
+    def micro(key):
+        # energy, charge, voltage, power and current are reported in micro units
+        try:
+            return int(values[key]) / 1000_000
+        except:
+            return None
 
-        with open(f'{DRIVER_DIR}/{directory}/temp1_input', 'r') as temperatureFile:
-            try:
-                temperature = float(temperatureFile.read()) / 1000
+    voltage = micro('VOLTAGE_NOW')
+    power = micro('POWER_NOW')
 
-            except:
-                temperature = None
+    if power is None and voltage is not None and (current := micro('CURRENT_NOW')) is not None:
+        power = abs(current) * voltage
 
-        sensors.append(
-            TemperatureSensor(
-                label=label,
-                temperature=temperature
-            )
-        )
+    online = values.get('ONLINE')
+    capacity = values.get('CAPACITY')
+    status = values.get('STATUS')
 
-    return sensors
+    return PowerSupply(
+        name=name,
+        supplyType=values.get('TYPE'),
+        online=online == '1' if online is not None else None,
+        status=status.lower() if status else None,
+        capacity=int(capacity) if capacity and capacity.isdigit() else None,
+        energyNow=micro('ENERGY_NOW'),
+        energyFull=micro('ENERGY_FULL'),
+        chargeNow=micro('CHARGE_NOW'),
+        chargeFull=micro('CHARGE_FULL'),
+        voltage=voltage,
+        power=power
+    )
 
-def cpuInfo():
+def powerSupplies():
     __linuxCheck()
 
-    with open('/proc/cpuinfo', 'r') as file:
-        infoFile = file.read()
+    supplies = []
 
-    modelName = ''
-    for line in infoFile.split('\n'):
-        if 'model name' in line:
-            modelName = line.split(':')[1].strip()
-            break
+    for name in __discovered('power_supply', 'supplies', __powerSupplyNames):
+        content = __readFile(f'/sys/class/power_supply/{name}/uevent')
 
-    DRIVER_DIR = '/sys/devices/system/cpu'
-    coreCount = 0
-    dieCount = 0
+        if content:
+            supplies.append(__parsePowerSupply(name, content))
 
-    for processor in os.listdir(DRIVER_DIR):
-        if 'cpu' not in processor:
-            continue
+    return supplies
 
-        try:
-            with open(f'{DRIVER_DIR}/{processor}/topology/core_id', 'r') as file:
-                coreId = file.read()
+class PowerSupplySampler:
+    def __init__(self):
+        self.__lastTime = time.monotonic()
 
-                if int(coreId) > coreCount:
-                    coreCount = int(coreId)
-        except:
-            pass
+        # name -> (energy, time of its last change, power measured between the last two changes)
+        self.__last = {supply.name : (self.__energy(supply)[0], self.__lastTime, None) for supply in powerSupplies()}
 
-        try:
-            with open(f'{DRIVER_DIR}/{processor}/topology/die_id', 'r') as file:
-                coreId = file.read()
+    @staticmethod
+    def __energy(supply):
+        # watt-hours, computed from the charge on gauges which report only that
+        if supply.energyNow is not None:
+            return supply.energyNow, supply.energyFull
 
-                if int(coreId) > coreCount:
-                    coreCount = int(coreId)
-        except:
-            pass
-    if coreCount % 2:
-        coreCount += 1
-    dieCount += 1
+        if supply.chargeNow is not None and supply.voltage:
+            full = supply.chargeFull * supply.voltage if supply.chargeFull is not None else None
+            return supply.chargeNow * supply.voltage, full
 
-    with open('/proc/cpuinfo', 'r') as file:
-        threadCount = file.read().count('processor')
+        return None, None
 
-    DRIVER_DIR = '/sys/devices/system/cpu/cpufreq'
-    maxFrequency = 0
+    def update(self):
+        supplies = powerSupplies()
+        now = time.monotonic()
 
-    governors = []
-    clockBoost = None
+        interval = now - self.__lastTime
+        current = {}
+        estimates = []
 
-    for policy in os.listdir(DRIVER_DIR):
-        if 'boost' in policy:
-            with open(f'{DRIVER_DIR}/{policy}', 'r') as boostFile:
-                clockBoost = True if boostFile.read() == '1' else False
+        for supply in supplies:
+            if supply.supplyType != 'Battery':
+                continue
 
-            continue
+            energy, full = self.__energy(supply)
+            before, changedAt, rate = self.__last.get(supply.name, (None, now, None))
 
-        elif 'policy' not in policy:
-            continue
+            if energy is None or before is None:
+                changedAt, rate = now, None
 
-        with open(f'{DRIVER_DIR}/{policy}/scaling_available_governors', 'r') as file:
-            localGovernors = file.read().strip().split(' ')
+            elif energy != before and now > changedAt:
+                # gauges refresh slower than the sampling interval, the rate is measured between two changes
+                # and kept until the next one; positive while discharging
+                rate = (before - energy) * 3600 / (now - changedAt)
+                changedAt = now
 
-            for governor in localGovernors:
-                if governor not in governors:
-                    governors.append(governor)
+            current[supply.name] = (energy, changedAt, rate)
 
-        with open(f'{DRIVER_DIR}/{policy}/cpuinfo_max_freq', 'r') as file:
-            if (maxFreq := int(file.read())) > maxFrequency:
-                maxFrequency = maxFreq
+            power = rate
+            if power is None and supply.power is not None:
+                # no change seen yet, fall back to the reported power
+                power = supply.power if supply.status == BatteryStatus.Discharging else -supply.power
 
-    maxFrequency /= 1000
-    arch = ''
+            timeToEmpty = None
+            timeToFull = None
 
-    if sys.maxsize == 2 ** (64 - 1) - 1:
-        arch = '64 bit'
+            if energy is not None and power:
+                if power > 0 and supply.status != BatteryStatus.Charging:
+                    timeToEmpty = energy / power * 3600
 
-    elif sys.maxsize == 2 ** (32 - 1) - 1:
-        arch = '32 bit'
+                elif power < 0 and full is not None:
+                    timeToFull = (full - energy) / -power * 3600
 
-    byteOrder = ''
-    if sys.byteorder == 'little':
-        byteOrder = 'Little Endian'
+            estimates.append(
+                PowerSupplyEstimate(
+                    name=supply.name,
+                    status=supply.status,
+                    power=power,
+                    timeToEmpty=timeToEmpty,
+                    timeToFull=timeToFull,
+                    interval=interval
+                )
+            )
 
-    elif sys.byteorder == 'big':
-        byteOrder = 'Big Endian'
+        self.__last = current
+        self.__lastTime = now
 
-    return CpuInfo(
-        modelName=modelName,
-        cores=coreCount,
-        threads=threadCount,
-        dies=dieCount,
-        governors=governors,
-        maxFrequencyMHz=maxFrequency,
-        clockBoost=clockBoost,
-        architecture=arch,
-        byteOrder=byteOrder
-    )
+        return estimates
 
-def ramSize():
+def batteryInfo():
     __linuxCheck()
 
-    with open('/proc/meminfo', 'r') as file:
-        memInfo = file.read().split('\n')
+    for supply in powerSupplies():
+        if supply.supplyType != 'Battery' or supply.capacity is None:
+            continue
 
-    memTotal = 0
-    for line in memInfo:
+        status = supply.status
+        if status not in (BatteryStatus.Charging, BatteryStatus.Discharging, BatteryStatus.Full):
+            status = None
 
-        if 'MemTotal' in line:
-            memTotal = int(line.split(' ')[-2].strip())
+        return Battery(
+            capacity=supply.capacity,
+            status=status
+        )
 
-    GiB = memTotal * 1000 / 1024 / 1024 / 1024
-    GB = memTotal / 1000 / 1000
+    return None
 
-    return RamSize(
-        gb=GB,
-        gib=GiB
-    )
+def gpuUsage():
+    __linuxCheck()
 
-def schedulerInfo():
+    try:
+        with open('/sys/class/drm/card0/device/gpu_busy_percent', 'r') as file:
+            return float(file.read().strip())
+
+    except:
+        return None
+
+def __firstInt(values):
+    try:
+        return int(values.split(' ', 1)[0])
+
+    except:
+        return 0
+
+def procStat(useNumpy=False):
     __linuxCheck()
 
-    DRIVER_DIR = '/sys/devices/system/cpu/cpufreq'
-    policies = []
+    with open('/proc/stat', 'r') as file:
+        content = file.read()
 
-    for dir in os.listdir(DRIVER_DIR):
-        if 'policy' not in dir:
-            continue
+    timestamp = time.monotonic()
 
-        policyName = dir
+    cpuLines = []
+    others = {}
 
-        with open(f'{DRIVER_DIR}/{dir}/scaling_governor', 'r') as file:
-            scalingGovernor = file.read().strip()
+    for line in content.split('\n'):
+        key, _, values = line.partition(' ')
 
-        with open(f'{DRIVER_DIR}/{dir}/scaling_driver', 'r') as file:
-            scalingDriver = file.read().strip()
+        if key.startswith('cpu'):
+            cpuLines.append(values)
 
-        with open(f'{DRIVER_DIR}/{dir}/scaling_max_freq', 'r') as file:
-            scalingMaxFreq = int(file.read().strip())
+        else:
+            others[key] = values
 
-        with open(f'{DRIVER_DIR}/{dir}/scaling_min_freq', 'r') as file:
-            scalingMinFreq = int(file.read().strip())
+    processors = len(cpuLines)
+    numpy = __backend('numpy') if useNumpy else None
 
-        policies.append(
-            SchedulerPolicy(
-                name=policyName,
-                scalingGovernor=scalingGovernor,
-                scalingDriver=scalingDriver,
-                minimumScalingMHz=scalingMinFreq,
-                maximumScalingMHz=scalingMaxFreq
-            )
-        )
+    if numpy is not None:
+        # parsed by NumPy straight from the text, without intermediate Python integers
+        counters = numpy.fromstring(' '.join(cpuLines), dtype=numpy.uint64, sep=' ')
+        counters = counters.reshape(processors, -1)
+        fields = counters.shape[1]
 
-    return policies
+    else:
+        counters = array.array('Q', map(int, ' '.join(cpuLines).split()))
+        fields = len(counters) // processors
+
+    return ProcStat(
+        processors=processors,
+        fields=fields,
+        counters=counters,
+        contextSwitches=__firstInt(others.get('ctxt', '')),
+        interrupts=__firstInt(others.get('intr', '')),
+        softInterrupts=__firstInt(others.get('softirq', '')),
+        processesCreated=__firstInt(others.get('processes', '')),
+        processesRunning=__firstInt(others.get('procs_running', '')),
+        processesBlocked=__firstInt(others.get('procs_blocked', '')),
+        timestamp=timestamp
+    )
 
-def vramSize():
-    __linuxCheck()
+def statDelta(before, after):
+    if before is not None and (before.processors != after.processors or before.fields != after.fields):
+        # processors went on or offline, counters are not comparable
+        before = None
 
-    try:
-        with open('/sys/class/drm/card0/device/mem_info_vram_total', 'r') as file:
-            fileContent = file.read()
+    rows = after.processors
+    fields = after.fields
 
-        intSize = int(fileContent.strip())
+    if not isinstance(after.counters, array.array):
+        # only NumPy samples have counters of another type
+        numpy = __backend('numpy')
 
-        return VramSize(
-            gb=intSize / 1000 / 1000 / 1000,
-            gib=intSize / 1024 / 1024 / 1024
-        )
-    except:
-        return None
+        deltas = after.counters.astype(numpy.float64)
+        if before is not None:
+            deltas -= before.counters
 
-def vramUsage():
-    __linuxCheck()
+        sums = deltas.sum(axis=1)
+        scale = numpy.divide(100, sums, out=numpy.zeros_like(sums), where=sums > 0)
 
-    try:
-        with open('/sys/class/drm/card0/device/mem_info_vram_total', 'r') as file:
-            fileContent = file.read()
+        percentages = (deltas * scale[:, None]).tolist()
+        totals = ((sums - deltas[:, 3]) * scale).tolist()
 
-        intSize = int(fileContent.strip())
+    else:
+        if before is not None:
+            deltas = list(map(operator.sub, after.counters, before.counters))
+        else:
+            deltas = list(after.counters)
+
+        percentages = []
+        totals = []
+
+        for row in range(rows):
+            rowDeltas = deltas[row * fields:(row + 1) * fields]
+            rowSum = sum(rowDeltas)
+            scale = 100 / rowSum if rowSum else 0.0
+
+            percentages.append([delta * scale for delta in rowDeltas])
+            totals.append((rowSum - rowDeltas[3]) * scale)
+
+    processors = [
+        ProcessorUsage(
+            total=totals[row],
+            user=percentage[0],
+            nice=percentage[1],
+            system=percentage[2],
+            idle=percentage[3],
+            iowait=percentage[4],
+            interrupt=percentage[5],
+            soft_interrupt=percentage[6]
+        ) for row, percentage in enumerate(percentages)
+    ]
 
-        with open('/sys/class/drm/card0/device/mem_info_vram_used', 'r') as file:
-            fileContent = file.read()
+    interval = after.timestamp - before.timestamp if before is not None else 0
 
-        intUsed = int(fileContent.strip())
+    def rate(field):
+        if interval <= 0:
+            return 0
 
-        return intUsed * 100 / intSize
+        return (getattr(after, field) - getattr(before, field)) / interval
 
-    except:
-        return None
+    return SystemActivity(
+        usage=CpuUsage(
+            average=processors[0],
+            processors=processors[1:]
+        ),
+        contextSwitches=rate('contextSwitches'),
+        interrupts=rate('interrupts'),
+        softInterrupts=rate('softInterrupts'),
+        processesCreated=rate('processesCreated'),
+        processesRunning=after.processesRunning,
+        processesBlocked=after.processesBlocked,
+        interval=interval
+    )
 
-def __bytesToAddress(address, separator):
-    chunks = []
+class StatSampler:
+    def __init__(self, useNumpy=False):
+        self.__useNumpy = useNumpy
+        self.__last = procStat(useNumpy)
 
-    for index in range(0, len(address), 2):
-        chunks.append(
-            str(int(address[index:index+2], 16))
-        )
+    def update(self):
+        current = procStat(self.__useNumpy)
+        activity = statDelta(self.__last, current)
 
-    chunks = chunks[::-1]
-    return separator.join(chunks)
+        self.__last = current
 
-def __bytesToPort(port):
-    LSB = port[:2]
-    MSB = port[2:]
+        return activity
 
-    return (int(MSB, 16) << 8) + (int(LSB, 16))
+class InterruptSampler:
+    INTERRUPTS_PATH = '/proc/interrupts'
+    SOFTIRQS_PATH = '/proc/softirqs'
 
-def __getRoutes(filePath, separator, routeType):
-    routes = []
+    # per-cpu counters are unsigned int in the kernel
+    __COUNTER_RANGE = 2 ** 32
 
-    try:
-        with open(filePath, 'r') as file:
-            fileContent = file.read()
+    def __init__(self):
+        # path -> (header, line count, (cpus, rows)), each row being (line prefix, counts per line, label, description)
+        self.__layouts = {}
 
-    except:
-        return []
+        self.__last = {
+            path : self.__sample(path) for path in (self.INTERRUPTS_PATH, self.SOFTIRQS_PATH)
+        }
+        self.__lastTime = time.monotonic()
 
-    for line in fileContent.split('\n'):
-        if ':' not in line:
-            continue
+    @staticmethod
+    def __layout(header, lines):
+        cpus = tuple(int(cpu[3:]) for cpu in header.split() if cpu[3:].isdigit())
+        rows = []
 
-        splittedLine = line.strip().split(' ')
-        local = splittedLine[1].split(':')
-        remote = splittedLine[2].split(':')
+        for line in lines:
+            prefix, colon, rest = line.partition(':')
+            if not colon:
+                continue
 
-        localAddress = __bytesToAddress(local[0], separator)
-        localPort = __bytesToPort(local[1])
+            tokens = rest.split()
+            counts = 0
 
-        remoteAddress = __bytesToAddress(remote[0], separator)
-        remotePort = __bytesToPort(remote[1])
+            while counts < len(cpus) and counts < len(tokens) and tokens[counts].isdigit():
+                counts += 1
 
-        statusCode = splittedLine[3]
-        if routeType in (RouteType.TCP, RouteType.TCP6):
-            status = RouteStatus.fromTcpCode(statusCode)
+            rows.append((prefix + colon, counts, prefix.strip(), ' '.join(tokens[counts:])))
 
-        else:
-            status = RouteStatus.LISTENING
+        return cpus, tuple(rows)
 
-        routes.append(
-            NetworkRoute (
-                routeType=routeType,
-                localAddress=localAddress,
-                localPort=localPort,
-                remoteAddress=remoteAddress,
-                remotePort=remotePort,
-                routeStatus=status
+    @staticmethod
+    def __counters(lines, layout, strict):
+        cpus, rows = layout
+        width = len(cpus)
+        counters = array.array('Q')
+
+        for line, (prefix, counts, _, _) in zip(lines, rows):
+            if strict and not line.startswith(prefix):
+                return None
+
+            fields = line[len(prefix):].split(None, counts)[:counts]
+
+            if len(fields) == counts and all(field.isdigit() for field in fields):
+                counters.extend(map(int, fields))
+
+            elif strict:
+                return None
+
+            else:
+                # unparsable row, reported as idle rather than failing the whole sample
+                counters.extend((0,) * counts)
+
+            if counts < width:
+                # global counters (ERR, MIS) are reported in the first column
+                counters.extend((0,) * (width - counts))
+
+        return counters
+
+    def __sample(self, path):
+        try:
+            with open(path, 'r') as file:
+                lines = file.read().rstrip('\n').split('\n')
+
+        except:
+            return (), array.array('Q')
+
+        header, lines = lines[0], lines[1:]
+        cached = self.__layouts.get(path)
+
+        # the header lists the online cpus, the layout is reused only while it and the line count are unchanged
+        if cached is not None and cached[0] == header and cached[1] == len(lines):
+            counters = self.__counters(lines, cached[2], True)
+
+            if counters is not None:
+                return cached[2], counters
+
+        # cpus went offline or online, interrupt lines were added, removed or reformatted
+        layout = self.__layout(header, lines)
+        self.__layouts[path] = (header, len(lines), layout)
+
+        return layout, self.__counters([line for line in lines if ':' in line], layout, False)
+
+    def __rates(self, previous, current, interval):
+        previousLayout, previousCounters = previous
+        layout, counters = current
+
+        if not layout:
+            return None
+
+        cpus, rows = layout
+        width = len(cpus)
+
+        rates = array.array('d', bytes(8 * len(counters)))
+
+        if previousLayout is layout or previousLayout == layout:
+            pairs = ((row, row) for row in range(len(rows)))
+
+        elif previousLayout and previousLayout[0] == cpus:
+            previousRows = {row[2] : index for index, row in enumerate(previousLayout[1])}
+            pairs = (
+                (index, previousRows[row[2]]) for index, row in enumerate(rows) if row[2] in previousRows
             )
-        )
 
-    return routes
+        else:
+            pairs = ()
 
-def networkRoutes():
-    __linuxCheck()
+        for row, previousRow in pairs:
+            offset = row * width
+            previousOffset = previousRow * width
 
-    routes = []
+            for column in range(width):
+                delta = counters[offset + column] - previousCounters[previousOffset + column]
 
-    routes.extend(
-        __getRoutes(
-            '/proc/net/tcp', '.', RouteType.TCP
-        )
-    )
+                if delta < 0:
+                    delta += self.__COUNTER_RANGE
 
-    routes.extend(
-        __getRoutes(
-            '/proc/net/udp', '.', RouteType.UDP
-        )
-    )
+                rates[offset + column] = delta / interval
 
-    routes.extend(
-        __getRoutes(
-            '/proc/net/tcp6', ':', RouteType.TCP6
+        return InterruptRates(
+            cpus=cpus,
+            labels=tuple(row[2] for row in rows),
+            descriptions=tuple(row[3] for row in rows),
+            rates=rates
         )
-    )
 
-    routes.extend(
-        __getRoutes(
-            '/proc/net/udp6', ':', RouteType.UDP6
+    def update(self):
+        current = {path : self.__sample(path) for path in self.__last}
+        now = time.monotonic()
+
+        interval = now - self.__lastTime
+        if interval <= 0:
+            return None
+
+        activity = InterruptActivity(
+            interrupts=self.__rates(self.__last[self.INTERRUPTS_PATH], current[self.INTERRUPTS_PATH], interval),
+            softInterrupts=self.__rates(self.__last[self.SOFTIRQS_PATH], current[self.SOFTIRQS_PATH], interval),
+            interval=interval
         )
-    )
 
-    return routes
+        self.__last = current
+        self.__lastTime = now
 
-def clockSource():
+        return activity
+
+@__coalesced
+def cpuUsage():
     __linuxCheck()
 
-    currentClockSource = ''
-    try:
-        with open('/sys/devices/system/clocksource/clocksource0/current_clocksource', 'r') as file:
-            currentClockSource = file.read().strip()
-    except:
-        pass
+    before = procStat()
+    time.sleep(0.25)
 
-    availableClockSources = []
-    try:
-        with open('/sys/devices/system/clocksource/clocksource0/available_clocksource', 'r') as file:
-            availableClockSources = file.read().strip().split(' ')
-    except:
-        pass
+    return statDelta(before, procStat()).usage
+
+__MEMINFO_FIELDS = {
+    'MemTotal' : 'total',
+    'MemFree' : 'free',
+    'MemAvailable' : 'available',
+    'Buffers' : 'buffers',
+    'Cached' : 'cached',
+    'SwapCached' : 'swapCached',
+    'Active' : 'active',
+    'Inactive' : 'inactive',
+    'Active(anon)' : 'activeAnon',
+    'Inactive(anon)' : 'inactiveAnon',
+    'Active(file)' : 'activeFile',
+    'Inactive(file)' : 'inactiveFile',
+    'Unevictable' : 'unevictable',
+    'Mlocked' : 'mlocked',
+    'SwapTotal' : 'swapTotal',
+    'SwapFree' : 'swapFree',
+    'Zswap' : 'zswap',
+    'Zswapped' : 'zswapped',
+    'Dirty' : 'dirty',
+    'Writeback' : 'writeback',
+    'AnonPages' : 'anonPages',
+    'Mapped' : 'mapped',
+    'Shmem' : 'shmem',
+    'KReclaimable' : 'kernelReclaimable',
+    'Slab' : 'slab',
+    'SReclaimable' : 'slabReclaimable',
+    'SUnreclaim' : 'slabUnreclaimable',
+    'KernelStack' : 'kernelStack',
+    'PageTables' : 'pageTables',
+    'CommitLimit' : 'commitLimit',
+    'Committed_AS' : 'committed',
+    'VmallocTotal' : 'vmallocTotal',
+    'VmallocUsed' : 'vmallocUsed',
+    'Percpu' : 'percpu',
+    'AnonHugePages' : 'anonHugePages',
+    'ShmemHugePages' : 'shmemHugePages',
+    'FileHugePages' : 'fileHugePages',
+    'HugePages_Total' : 'hugePagesTotal',
+    'HugePages_Free' : 'hugePagesFree',
+    'HugePages_Rsvd' : 'hugePagesReserved',
+    'HugePages_Surp' : 'hugePagesSurplus',
+    'Hugepagesize' : 'hugePageSize',
+    'Hugetlb' : 'hugetlb'
+}
+
+# one entry per /proc/meminfo line: (field, value start, value end from line end, unit multiplier)
+__meminfoLayout = None
+
+def __buildMeminfoLayout(lines):
+    layout = []
 
-    return ClockSource(
-        current=currentClockSource,
-        available=availableClockSources
-    )
+    for line in lines:
+        key, _, value = line.partition(':')
+        kilobytes = value.endswith(' kB')
+
+        layout.append((
+            key + ':',
+            __MEMINFO_FIELDS.get(key),
+            len(key) + 1,
+            -3 if kilobytes else None,
+            1024 if kilobytes else 1
+        ))
 
-def biosInfo():
+    return tuple(layout)
+
+def __parseMeminfo(content):
+    global __meminfoLayout
+
+    lines = content.strip().split('\n')
+    layout = __meminfoLayout
+
+    # a cached layout is tried first, a freshly built one is trusted and its unparsable lines skipped
+    for fresh in (False, True):
+        if fresh or layout is None or len(layout) != len(lines):
+            layout = __buildMeminfoLayout(lines)
+            __meminfoLayout = layout
+            fresh = True
+
+        values = dict.fromkeys(__MEMINFO_FIELDS.values(), 0)
+        valid = True
+
+        for (prefix, field, start, end, multiplier), line in zip(layout, lines):
+            if not line.startswith(prefix):
+                # fields were reordered, the layout must be built again
+                valid = False
+                break
+
+            if field is None:
+                continue
+
+            try:
+                values[field] = int(line[start:end]) * multiplier
+            except:
+                if not fresh:
+                    valid = False
+                    break
+
+        if valid:
+            return values
+
+    return values
+
+__VMSTAT_FIELDS = {
+    'pgfault' : 'pageFaults',
+    'pgmajfault' : 'majorPageFaults',
+    'pgpgin' : 'pagesIn',
+    'pgpgout' : 'pagesOut',
+    'pswpin' : 'swapIn',
+    'pswpout' : 'swapOut',
+    'pgscan_kswapd' : 'pagesScanned',
+    'pgscan_direct' : 'pagesScanned',
+    'pgscan_khugepaged' : 'pagesScanned',
+    'pgscan_proactive' : 'pagesScanned',
+    'pgsteal_kswapd' : 'pagesReclaimed',
+    'pgsteal_direct' : 'pagesReclaimed',
+    'pgsteal_khugepaged' : 'pagesReclaimed',
+    'pgsteal_proactive' : 'pagesReclaimed',
+    'allocstall_dma' : 'allocationStalls',
+    'allocstall_dma32' : 'allocationStalls',
+    'allocstall_normal' : 'allocationStalls',
+    'allocstall_movable' : 'allocationStalls',
+    'allocstall_device' : 'allocationStalls',
+    'oom_kill' : 'oomKills'
+}
+
+def vmstatInfo():
     __linuxCheck()
 
-    vendor = ''
-    try:
-        with open('/sys/devices/virtual/dmi/id/bios_vendor', 'r') as file:
-            vendor = file.read().strip()
-    except:
-        pass
+    values = dict.fromkeys(__VMSTAT_FIELDS.values(), 0)
 
-    release = ''
-    try:
-        with open('/sys/devices/virtual/dmi/id/bios_release', 'r') as file:
-            release = file.read().strip()
-    except:
-        pass
+    for line in __readFile('/proc/vmstat').split('\n'):
+        key, _, value = line.partition(' ')
 
-    version = ''
-    try:
-        with open('/sys/devices/virtual/dmi/id/bios_version', 'r') as file:
-            version = file.read().strip()
-    except:
-        pass
+        if (field := __VMSTAT_FIELDS.get(key)) is not None:
+            values[field] += int(value)
 
-    date = ''
-    try:
-        with open('/sys/devices/virtual/dmi/id/bios_date', 'r') as file:
-            date = file.read().strip()
-    except:
-        pass
+    return VmStat(**values)
 
-    return Bios(
-        vendor=vendor,
-        version=version,
-        release=release,
-        date=date
-    )
+class VmStatSampler:
+    def __init__(self):
+        self.__last = vmstatInfo()
+        self.__lastTime = time.monotonic()
 
-def motherboardInfo():
+    def update(self):
+        current = vmstatInfo()
+        now = time.monotonic()
+
+        interval = now - self.__lastTime
+        if interval <= 0:
+            return None
+
+        rates = {
+            field.name : (getattr(current, field.name) - getattr(self.__last, field.name)) / interval
+            for field in dataclasses.fields(VmStat)
+        }
+
+        self.__last = current
+        self.__lastTime = now
+
+        return VmStat(**rates)
+
+def memoryInfo(vmstat=False):
     __linuxCheck()
 
-    name = ''
-    try:
-        with open('/sys/devices/virtual/dmi/id/board_name', 'r') as file:
-            name = file.read().strip()
-    except:
-        pass
+    values = __parsedFile('/proc/meminfo', __parseMeminfo)
 
-    vendor = ''
-    try:
-        with open('/sys/devices/virtual/dmi/id/board_vendor', 'r') as file:
-            vendor = file.read().strip()
-    except:
-        pass
+    return MemoryInfo(
+        **values,
+        vmstat=vmstatInfo() if vmstat else None
+    )
 
-    version = ''
-    try:
+def ramUsage():
+    __linuxCheck()
+
+    values = __parsedFile('/proc/meminfo', __parseMeminfo)
+    return 100 - values['available'] * 100 / values['total']
+
+def __parseNetDev(content):
+    interfaces = {}
+
+    # the first two lines are headers
+    for line in content.split('\n')[2:]:
+        name, colon, values = line.partition(':')
+
+        if colon:
+            interfaces[name.strip()] = [int(value) for value in values.split()]
+
+    return interfaces
+
+def __getRate():
+    with open('/proc/net/dev', 'r') as file:
+        stats = file.read()
+
+    downloadRate = 0
+    uploadRate = 0
+
+    for data in __parseNetDev(stats).values():
+        downloadRate += data[0]
+        uploadRate += data[8]
+
+    return downloadRate, uploadRate
+
+def interfaceCounters():
+    __linuxCheck()
+
+    counters = {}
+
+    for name, values in __parseNetDev(__readFile('/proc/net/dev')).items():
+        counters[name] = InterfaceCounters(*values[:16])
+
+    return counters
+
+@__coalesced
+def networkRate():
+    __linuxCheck()
+
+    downBefore, upBefore = __getRate()
+    time.sleep(0.5)
+    downAfter, upAfter = __getRate()
+
+    return NetworkRate (
+        download=(downAfter - downBefore) / 0.5,
+        upload=(upAfter - upBefore) / 0.5
+    )
+
+class NetworkRateSampler:
+    def __init__(self):
+        self.__last = self.__totals()
+        self.__lastTime = time.monotonic()
+
+    @staticmethod
+    def __totals():
+        counters = interfaceCounters().values()
+        return sum(counter.rxBytes for counter in counters), sum(counter.txBytes for counter in counters)
+
+    def update(self):
+        current = self.__totals()
+        now = time.monotonic()
+
+        interval = now - self.__lastTime
+        if interval <= 0:
+            return None
+
+        rate = NetworkRate(
+            download=(current[0] - self.__last[0]) / interval,
+            upload=(current[1] - self.__last[1]) / interval
+        )
+
+        self.__last = current
+        self.__lastTime = now
+
+        return rate
+
+def temperatureSensors():
+    __linuxCheck()
+
+    DRIVER_DIR = '/sys/class/hwmon'
+    sensorsDirectories = os.listdir(DRIVER_DIR)
+
+    sensors = []
+    for directory in sensorsDirectories:
+        with open(f'{DRIVER_DIR}/{directory}/name', 'r') as labelFile:
+            label = labelFile.read().strip()
+
+        with open(f'{DRIVER_DIR}/{directory}/temp1_input', 'r') as temperatureFile:
+            try:
+                temperature = float(temperatureFile.read()) / 1000
+
+            except:
+                temperature = None
+
+        sensors.append(
+            TemperatureSensor(
+                label=label,
+                temperature=temperature
+            )
+        )
+
+    return sensors
+
+class ThermalSampler(_DescriptorSampler):
+    THERMAL_DIR = '/sys/class/thermal'
+    CPU_DIR = '/sys/devices/system/cpu'
+
+    def __init__(self):
+        # static attributes are read once, value files are kept open and re-read with pread
+        super().__init__()
+
+        self.__zones = []
+        self.__coolingDevices = []
+        self.__throttles = []
+
+        try:
+            entries = sorted(os.listdir(self.THERMAL_DIR), key=self.__entryIndex)
+        except:
+            entries = []
+
+        for entry in entries:
+            path = f'{self.THERMAL_DIR}/{entry}'
+
+            if entry.startswith('thermal_zone'):
+                fd = self._open(f'{path}/temp')
+
+                if fd is not None:
+                    self.__zones.append((entry, _readText(f'{path}/type'), self.__tripPoints(path), fd))
+
+            elif entry.startswith('cooling_device'):
+                fd = self._open(f'{path}/cur_state')
+
+                if fd is not None:
+                    maximum = _readText(f'{path}/max_state')
+                    maximum = int(maximum) if maximum.isdigit() else None
+
+                    self.__coolingDevices.append((entry, _readText(f'{path}/type'), maximum, fd))
+
+        try:
+            processors = [entry for entry in os.listdir(self.CPU_DIR) if entry[:3] == 'cpu' and entry[3:].isdigit()]
+        except:
+            processors = []
+
+        for processor in sorted(processors, key=self.__entryIndex):
+            path = f'{self.CPU_DIR}/{processor}/thermal_throttle'
+
+            core = self._open(f'{path}/core_throttle_count')
+            package = self._open(f'{path}/package_throttle_count')
+
+            if core is not None or package is not None:
+                self.__throttles.append((int(processor[3:]), core, package))
+
+        self.__last = self.__throttleCounts()
+        self.__lastTime = time.monotonic()
+
+    @staticmethod
+    def __entryIndex(entry):
+        digits = entry.lstrip('abcdefghijklmnopqrstuvwxyz_')
+        return (entry[:len(entry) - len(digits)], int(digits) if digits.isdigit() else -1)
+
+    def __tripPoints(self, path):
+        tripPoints = []
+        index = 0
+
+        while True:
+            tripType = _readText(f'{path}/trip_point_{index}_type')
+            if not tripType:
+                break
+
+            temperature = _readText(f'{path}/trip_point_{index}_temp')
+            hysteresis = _readText(f'{path}/trip_point_{index}_hyst')
+
+            tripPoints.append(
+                TripPoint(
+                    tripType=tripType,
+                    temperature=int(temperature) / 1000 if temperature.lstrip('-').isdigit() else None,
+                    hysteresis=int(hysteresis) / 1000 if hysteresis.lstrip('-').isdigit() else None
+                )
+            )
+
+            index += 1
+
+        return tripPoints
+
+    def __throttleCounts(self):
+        return [(self._value(core), self._value(package)) for _, core, package in self.__throttles]
+
+    def close(self):
+        super().close()
+
+        self.__zones = []
+        self.__coolingDevices = []
+        self.__throttles = []
+
+    def update(self):
+        counts = self.__throttleCounts()
+        now = time.monotonic()
+
+        zones = []
+        for name, zoneType, tripPoints, fd in self.__zones:
+            temperature = self._value(fd)
+
+            zones.append(
+                ThermalZone(
+                    name=name,
+                    zoneType=zoneType,
+                    temperature=temperature / 1000 if temperature is not None else None,
+                    tripPoints=tripPoints
+                )
+            )
+
+        coolingDevices = [
+            CoolingDevice(name=name, deviceType=deviceType, state=self._value(fd), maximumState=maximum)
+            for name, deviceType, maximum, fd in self.__coolingDevices
+        ]
+
+        throttling = []
+        for (cpu, _, _), (core, package), (lastCore, lastPackage) in zip(self.__throttles, counts, self.__last):
+            throttling.append(
+                ThrottleEvents(
+                    cpu=cpu,
+                    core=core - lastCore if core is not None and lastCore is not None else None,
+                    package=package - lastPackage if package is not None and lastPackage is not None else None
+                )
+            )
+
+        state = ThermalState(
+            zones=zones,
+            coolingDevices=coolingDevices,
+            throttling=throttling,
+            interval=now - self.__lastTime
+        )
+
+        self.__last = counts
+        self.__lastTime = now
+
+        return state
+
+class PowerSampler(_DescriptorSampler):
+    POWERCAP_DIR = '/sys/class/powercap'
+    HWMON_DIR = '/sys/class/hwmon'
+
+    def __init__(self):
+        # (zone, name, package, counter range, fd); counters are in microjoules
+        super().__init__()
+
+        self.__zones = []
+
+        try:
+            # msr zones first, so that the mmio zones duplicating them can be recognised
+            entries = sorted(os.listdir(self.POWERCAP_DIR), key=lambda entry: ('mmio' in entry, entry))
+        except:
+            entries = []
+
+        names = {}
+        packages = set()
+
+        for entry in entries:
+            # control types (intel-rapl, intel-rapl-mmio) have no energy counter, zones are named type:index[:index]
+            if 'rapl' not in entry or ':' not in entry:
+                continue
+
+            path = f'{self.POWERCAP_DIR}/{entry}'
+            name = _readText(f'{path}/name')
+
+            if 'mmio' in entry and name in packages:
+                # intel-rapl-mmio:N measures the same package as the msr zone intel-rapl:N
+                continue
+
+            fd = self._open(f'{path}/energy_uj')
+
+            if fd is None:
+                # energy counters are readable only by root on most distributions
+                continue
+
+            names[entry] = name
+
+            if 'mmio' not in entry and entry.count(':') == 1:
+                packages.add(name)
+
+            maximum = _readText(f'{path}/max_energy_range_uj')
+            maximum = int(maximum) if maximum.isdigit() else None
+
+            parent = entry.rpartition(':')[0]
+            package = names.get(parent, name) if parent.count(':') else name
+
+            self.__zones.append((entry, name, package, maximum, fd))
+
+        if not self.__zones:
+            self.__discoverAmdEnergy()
+
+        self.__last = self.__sample()
+        self.__lastTime = time.monotonic()
+
+    def __discoverAmdEnergy(self):
+        try:
+            entries = sorted(os.listdir(self.HWMON_DIR))
+        except:
+            return
+
+        for entry in entries:
+            path = f'{self.HWMON_DIR}/{entry}'
+
+            if _readText(f'{path}/name') != 'amd_energy':
+                continue
+
+            try:
+                files = sorted(os.listdir(path))
+            except:
+                continue
+
+            for file in files:
+                if not file.startswith('energy') or not file.endswith('_input'):
+                    continue
+
+                fd = self._open(f'{path}/{file}')
+                if fd is None:
+                    continue
+
+                # labels are Esocket<n> for packages and Ecore<n> for cores
+                label = _readText(f'{path}/{file[:-6]}_label') or file[:-6]
+                package = label if label.startswith('Esocket') else None
+
+                self.__zones.append((f'{entry}:{file[:-6]}', label, package, None, fd))
+
+    def __sample(self):
+        return [self._value(fd) for *_, fd in self.__zones]
+
+    def close(self):
+        super().close()
+
+        self.__zones = []
+
+    def update(self):
+        current = self.__sample()
+        now = time.monotonic()
+
+        interval = now - self.__lastTime
+        zones = []
+
+        for (zone, name, package, maximum, _), before, after in zip(self.__zones, self.__last, current):
+            watts = None
+
+            if before is not None and after is not None and interval > 0:
+                delta = after - before
+
+                if delta < 0 and maximum:
+                    # the counter wraps to zero at max_energy_range_uj
+                    delta += maximum
+
+                if delta >= 0:
+                    watts = delta / interval / 1000_000
+
+            zones.append(
+                PowerZone(
+                    zone=zone,
+                    name=name,
+                    package=package,
+                    energy=after / 1000_000 if after is not None else None,
+                    watts=watts
+                )
+            )
+
+        self.__last = current
+        self.__lastTime = now
+
+        return PowerUsage(zones=zones, interval=interval)
+
+def __parseCpuList(cpuList):
+    cpus = []
+
+    for chunk in cpuList.strip().split(','):
+        if not chunk:
+            continue
+
+        if '-' in chunk:
+            first, last = chunk.split('-')
+            cpus.extend(range(int(first), int(last) + 1))
+
+        else:
+            cpus.append(int(chunk))
+
+    return cpus
+
+def __readInt(filePath, default=None):
+    try:
+        return int(__readFile(filePath).strip())
+
+    except:
+        return default
+
+def __cacheSize(size):
+    size = size.strip()
+    multipliers = {'K' : 1024, 'M' : 1024 ** 2, 'G' : 1024 ** 3}
+
+    if size and size[-1] in multipliers:
+        return int(size[:-1]) * multipliers[size[-1]]
+
+    try:
+        return int(size)
+    except:
+        return 0
+
+__topology = None
+
+def cpuTopology():
+    global __topology
+    __linuxCheck()
+
+    if __topology is not None:
+        return __topology
+
+    DRIVER_DIR = '/sys/devices/system/cpu'
+
+    cores = {}
+    caches = []
+    seenCaches = set()
+    threadCount = 0
+
+    for processor in os.listdir(DRIVER_DIR):
+        if not processor.startswith('cpu') or not processor[3:].isdigit():
+            continue
+
+        cpuId = int(processor[3:])
+        path = f'{DRIVER_DIR}/{processor}'
+
+        coreId = __readInt(f'{path}/topology/core_id')
+        if coreId is None:
+            # offline processors expose no topology
+            continue
+
+        package = __readInt(f'{path}/topology/physical_package_id', 0)
+        die = __readInt(f'{path}/topology/die_id', 0)
+        threadCount += 1
+
+        cores.setdefault((package, die, coreId), []).append(cpuId)
+
+        try:
+            indexes = os.listdir(f'{path}/cache')
+        except:
+            indexes = []
+
+        for index in indexes:
+            if not index.startswith('index'):
+                continue
+
+            indexPath = f'{path}/cache/{index}'
+            sharedCpus = __readFile(f'{indexPath}/shared_cpu_list').strip()
+
+            if (index, sharedCpus) in seenCaches:
+                continue
+            seenCaches.add((index, sharedCpus))
+
+            caches.append(CpuCache(
+                level=__readInt(f'{indexPath}/level', 0),
+                cacheType=__readFile(f'{indexPath}/type').strip(),
+                size=ByteSize(__cacheSize(__readFile(f'{indexPath}/size'))),
+                lineSize=__readInt(f'{indexPath}/coherency_line_size', 0),
+                ways=__readInt(f'{indexPath}/ways_of_associativity', 0),
+                sharedCpus=tuple(__parseCpuList(sharedCpus))
+            ))
+
+    nodes = []
+    NODE_DIR = '/sys/devices/system/node'
+
+    try:
+        nodeDirs = os.listdir(NODE_DIR)
+    except:
+        nodeDirs = []
+
+    for node in nodeDirs:
+        if not node.startswith('node') or not node[4:].isdigit():
+            continue
+
+        distances = __readFile(f'{NODE_DIR}/{node}/distance').strip()
+
+        nodes.append(NumaNode(
+            id=int(node[4:]),
+            cpus=tuple(__parseCpuList(__readFile(f'{NODE_DIR}/{node}/cpulist'))),
+            distances=tuple(int(distance) for distance in distances.split())
+        ))
+
+    coreList = [
+        CpuCore(package=package, die=die, core=coreId, threads=tuple(sorted(threads)))
+        for (package, die, coreId), threads in sorted(cores.items())
+    ]
+
+    caches.sort(key=lambda cache: (cache.level, cache.cacheType, cache.sharedCpus))
+    nodes.sort(key=lambda node: node.id)
+
+    __topology = CpuTopology(
+        packages=len({core.package for core in coreList}),
+        dies=len({(core.package, core.die) for core in coreList}),
+        cores=tuple(coreList),
+        threads=threadCount,
+        caches=tuple(caches),
+        nodes=tuple(nodes)
+    )
+
+    return __topology
+
+def numaMemory():
+    __linuxCheck()
+
+    memory = {}
+
+    for node in cpuTopology().nodes:
+        values = dict.fromkeys(__MEMINFO_FIELDS.values(), 0)
+
+        for line in __readFile(f'/sys/devices/system/node/node{node.id}/meminfo').split('\n'):
+            # lines look like 'Node 0 MemTotal:  4030200 kB'
+            chunks = line.split()
+            if len(chunks) < 4:
+                continue
+
+            field = __MEMINFO_FIELDS.get(chunks[2].rstrip(':'))
+            if field is None:
+                continue
+
+            values[field] = int(chunks[3]) * (1024 if len(chunks) > 4 else 1)
+
+        memory[node.id] = MemoryInfo(**values, vmstat=None)
+
+    return memory
+
+def cpuInfo():
+    __linuxCheck()
+
+    infoFile = __readFile('/proc/cpuinfo')
+
+    modelName = ''
+    for line in infoFile.split('\n'):
+        if 'model name' in line:
+            modelName = line.split(':')[1].strip()
+            break
+
+    topology = cpuTopology()
+    coreCount = len(topology.cores)
+    dieCount = topology.dies
+
+    threadCount = infoFile.count('processor')
+
+    DRIVER_DIR = '/sys/devices/system/cpu/cpufreq'
+    maxFrequency = 0
+
+    governors = []
+    clockBoost = None
+
+    for policy in os.listdir(DRIVER_DIR):
+        if 'boost' in policy:
+            with open(f'{DRIVER_DIR}/{policy}', 'r') as boostFile:
+                clockBoost = True if boostFile.read() == '1' else False
+
+            continue
+
+        elif 'policy' not in policy:
+            continue
+
+        with open(f'{DRIVER_DIR}/{policy}/scaling_available_governors', 'r') as file:
+            localGovernors = file.read().strip().split(' ')
+
+            for governor in localGovernors:
+                if governor not in governors:
+                    governors.append(governor)
+
+        with open(f'{DRIVER_DIR}/{policy}/cpuinfo_max_freq', 'r') as file:
+            if (maxFreq := int(file.read())) > maxFrequency:
+                maxFrequency = maxFreq
+
+    maxFrequency /= 1000
+    arch = ''
+
+    if sys.maxsize == 2 ** (64 - 1) - 1:
+        arch = '64 bit'
+
+    elif sys.maxsize == 2 ** (32 - 1) - 1:
+        arch = '32 bit'
+
+    byteOrder = ''
+    if sys.byteorder == 'little':
+        byteOrder = 'Little Endian'
+
+    elif sys.byteorder == 'big':
+        byteOrder = 'Big Endian'
+
+    return CpuInfo(
+        modelName=modelName,
+        cores=coreCount,
+        threads=threadCount,
+        dies=dieCount,
+        governors=governors,
+        maxFrequencyMHz=maxFrequency,
+        clockBoost=clockBoost,
+        architecture=arch,
+        byteOrder=byteOrder
+    )
+
+def ramSize():
+    __linuxCheck()
+
+    memTotal = __parsedFile('/proc/meminfo', __parseMeminfo)['total'] // 1024
+
+    GiB = memTotal * 1000 / 1024 / 1024 / 1024
+    GB = memTotal / 1000 / 1000
+
+    return RamSize(
+        gb=GB,
+        gib=GiB
+    )
+
+def schedulerInfo():
+    __linuxCheck()
+
+    DRIVER_DIR = '/sys/devices/system/cpu/cpufreq'
+    policies = []
+
+    for dir in os.listdir(DRIVER_DIR):
+        if 'policy' not in dir:
+            continue
+
+        policyName = dir
+
+        with open(f'{DRIVER_DIR}/{dir}/scaling_governor', 'r') as file:
+            scalingGovernor = file.read().strip()
+
+        with open(f'{DRIVER_DIR}/{dir}/scaling_driver', 'r') as file:
+            scalingDriver = file.read().strip()
+
+        with open(f'{DRIVER_DIR}/{dir}/scaling_max_freq', 'r') as file:
+            scalingMaxFreq = int(file.read().strip())
+
+        with open(f'{DRIVER_DIR}/{dir}/scaling_min_freq', 'r') as file:
+            scalingMinFreq = int(file.read().strip())
+
+        policies.append(
+            SchedulerPolicy(
+                name=policyName,
+                scalingGovernor=scalingGovernor,
+                scalingDriver=scalingDriver,
+                minimumScalingMHz=scalingMinFreq,
+                maximumScalingMHz=scalingMaxFreq
+            )
+        )
+
+    return policies
+
+def vramSize():
+    __linuxCheck()
+
+    try:
+        with open('/sys/class/drm/card0/device/mem_info_vram_total', 'r') as file:
+            fileContent = file.read()
+
+        intSize = int(fileContent.strip())
+
+        return VramSize(
+            gb=intSize / 1000 / 1000 / 1000,
+            gib=intSize / 1024 / 1024 / 1024
+        )
+    except:
+        return None
+
+def vramUsage():
+    __linuxCheck()
+
+    try:
+        with open('/sys/class/drm/card0/device/mem_info_vram_total', 'r') as file:
+            fileContent = file.read()
+
+        intSize = int(fileContent.strip())
+
+        with open('/sys/class/drm/card0/device/mem_info_vram_used', 'r') as file:
+            fileContent = file.read()
+
+        intUsed = int(fileContent.strip())
+
+        return intUsed * 100 / intSize
+
+    except:
+        return None
+
+def __bytesToAddress(address, separator):
+    chunks = []
+
+    for index in range(0, len(address), 2):
+        chunks.append(
+            str(int(address[index:index+2], 16))
+        )
+
+    chunks = chunks[::-1]
+    return separator.join(chunks)
+
+def __bytesToPort(port):
+    # ports are printed as big endian hexadecimal, regardless of the host byte order
+    return int(port, 16)
+
+def __getRoutes(filePath, separator, routeType):
+    routes = []
+
+    try:
+        with open(filePath, 'r') as file:
+            fileContent = file.read()
+
+    except:
+        return []
+
+    for line in fileContent.split('\n'):
+        if ':' not in line:
+            continue
+
+        splittedLine = line.strip().split(' ')
+        local = splittedLine[1].split(':')
+        remote = splittedLine[2].split(':')
+
+        localAddress = __bytesToAddress(local[0], separator)
+        localPort = __bytesToPort(local[1])
+
+        remoteAddress = __bytesToAddress(remote[0], separator)
+        remotePort = __bytesToPort(remote[1])
+
+        statusCode = splittedLine[3]
+        if routeType in (RouteType.TCP, RouteType.TCP6):
+            status = RouteStatus.fromTcpCode(statusCode)
+
+        else:
+            status = RouteStatus.LISTENING
+
+        try:
+            inode = int(line.split()[9])
+        except:
+            inode = 0
+
+        routes.append(
+            NetworkRoute (
+                routeType=routeType,
+                localAddress=localAddress,
+                localPort=localPort,
+                remoteAddress=remoteAddress,
+                remotePort=remotePort,
+                routeStatus=status,
+                inode=inode
+            )
+        )
+
+    return routes
+
+def networkRoutes():
+    __linuxCheck()
+
+    routes = []
+
+    routes.extend(
+        __getRoutes(
+            '/proc/net/tcp', '.', RouteType.TCP
+        )
+    )
+
+    routes.extend(
+        __getRoutes(
+            '/proc/net/udp', '.', RouteType.UDP
+        )
+    )
+
+    routes.extend(
+        __getRoutes(
+            '/proc/net/tcp6', ':', RouteType.TCP6
+        )
+    )
+
+    routes.extend(
+        __getRoutes(
+            '/proc/net/udp6', ':', RouteType.UDP6
+        )
+    )
+
+    return routes
+
+def __parseCounterTables(content, tables):
+    lines = content.split('\n')
+
+    # tables are pairs of lines: 'Name: key key ...' followed by 'Name: value value ...'
+    for header, values in zip(lines[::2], lines[1::2]):
+        name, _, keys = header.partition(':')
+        _, _, numbers = values.partition(':')
+
+        table = tables.setdefault(name, {})
+        for key, number in zip(keys.split(), numbers.split()):
+            table[key] = int(number)
+
+def __parseSockstat(content, tables):
+    for line in content.split('\n'):
+        name, _, values = line.partition(':')
+        chunks = values.split()
+
+        if not chunks:
+            continue
+
+        table = tables.setdefault(name, {})
+        for key, number in zip(chunks[::2], chunks[1::2]):
+            table[key] = int(number)
+
+def netStatistics():
+    __linuxCheck()
+
+    tables = {}
+
+    __parseCounterTables(__readFile('/proc/net/snmp'), tables)
+    __parseCounterTables(__readFile('/proc/net/netstat'), tables)
+
+    sockets = {}
+    __parseSockstat(__readFile('/proc/net/sockstat'), sockets)
+
+    for name, table in sockets.items():
+        tables[f'sockstat {name}'] = table
+
+    return tables
+
+def tcpStatistics():
+    __linuxCheck()
+
+    tables = netStatistics()
+
+    tcp = tables.get('Tcp', {})
+    tcpExt = tables.get('TcpExt', {})
+    sockets = tables.get('sockstat TCP', {})
+
+    return TcpStatistics(
+        activeOpens=tcp.get('ActiveOpens', 0),
+        passiveOpens=tcp.get('PassiveOpens', 0),
+        attemptFails=tcp.get('AttemptFails', 0),
+        establishedResets=tcp.get('EstabResets', 0),
+        currentEstablished=tcp.get('CurrEstab', 0),
+        inSegments=tcp.get('InSegs', 0),
+        outSegments=tcp.get('OutSegs', 0),
+        retransmittedSegments=tcp.get('RetransSegs', 0),
+        inErrors=tcp.get('InErrs', 0),
+        outResets=tcp.get('OutRsts', 0),
+        timeouts=tcpExt.get('TCPTimeouts', 0),
+        listenOverflows=tcpExt.get('ListenOverflows', 0),
+        listenDrops=tcpExt.get('ListenDrops', 0),
+        socketsInUse=sockets.get('inuse', 0),
+        orphans=sockets.get('orphan', 0),
+        timeWait=sockets.get('tw', 0),
+        allocated=sockets.get('alloc', 0),
+        memoryPages=sockets.get('mem', 0)
+    )
+
+class TcpStatisticsSampler:
+    # values describing the current state, reported as they are instead of as deltas
+    GAUGES = ('currentEstablished', 'socketsInUse', 'orphans', 'timeWait', 'allocated', 'memoryPages')
+
+    def __init__(self):
+        self.__last = tcpStatistics()
+
+    def update(self):
+        current = tcpStatistics()
+        values = {}
+
+        for field in dataclasses.fields(TcpStatistics):
+            value = getattr(current, field.name)
+
+            if field.name not in self.GAUGES:
+                value -= getattr(self.__last, field.name)
+
+            values[field.name] = value
+
+        self.__last = current
+        return TcpStatistics(**values)
+
+__ROUTE_FILES = (
+    ('/proc/net/tcp', RouteType.TCP),
+    ('/proc/net/udp', RouteType.UDP),
+    ('/proc/net/tcp6', RouteType.TCP6),
+    ('/proc/net/udp6', RouteType.UDP6)
+)
+
+def connectionSummary(ports=False):
+    __linuxCheck()
+
+    total = 0
+    counts = {}
+    localPorts = {} if ports else None
+
+    for filePath, routeType in __ROUTE_FILES:
+        lines = __readFile(filePath).split('\n')[1:]
+        codes = {}
+
+        for line in lines:
+            # sl, local address, remote address, state, rest of the line
+            fields = line.split(None, 4)
+            if len(fields) < 4:
+                continue
+
+            code = fields[3]
+            codes[code] = codes.get(code, 0) + 1
+
+            if ports:
+                port = fields[1][-4:]
+                localPorts[port] = localPorts.get(port, 0) + 1
+
+        statuses = {}
+
+        for code, count in codes.items():
+            if routeType in (RouteType.TCP, RouteType.TCP6):
+                status = TCP_STATES.get(code)
+            else:
+                status = RouteStatus.LISTENING
+
+            statuses[status] = statuses.get(status, 0) + count
+            total += count
+
+        counts[routeType] = statuses
+
+    if ports:
+        localPorts = {int(port, 16) : count for port, count in localPorts.items()}
+
+    return ConnectionSummary(
+        total=total,
+        counts=counts,
+        localPorts=localPorts
+    )
+
+class SocketOwnerIndex:
+    def __init__(self, fullRescanInterval=30.0):
+        # processes may open sockets after being scanned, so every known process is rescanned periodically
+        self.fullRescanInterval = fullRescanInterval
+
+        self.__processInodes = {}
+        self.__owners = {}
+        self.__commands = {}
+        self.__lastFullScan = None
+
+        # inodes no process could be found for after a full scan (other users' processes, closed sockets)
+        self.__unowned = set()
+
+    def __scanProcess(self, pid):
+        self.__forgetProcess(pid)
+
+        inodes = set()
+        fdDir = f'/proc/{pid}/fd'
+
+        try:
+            fds = os.listdir(fdDir)
+        except:
+            fds = []
+
+        for fd in fds:
+            try:
+                target = os.readlink(f'{fdDir}/{fd}')
+            except:
+                continue
+
+            if target.startswith('socket:['):
+                inode = int(target[8:-1])
+
+                inodes.add(inode)
+                self.__owners[inode] = pid
+
+        self.__processInodes[pid] = inodes
+
+        try:
+            with open(f'/proc/{pid}/comm', 'r') as file:
+                self.__commands[pid] = file.read().strip()
+        except:
+            self.__commands[pid] = None
+
+    def __forgetProcess(self, pid):
+        for inode in self.__processInodes.pop(pid, ()):
+            if self.__owners.get(inode) == pid:
+                del self.__owners[inode]
+
+        self.__commands.pop(pid, None)
+
+    def refresh(self, full=False):
+        pids = {int(pid) for pid in os.listdir('/proc') if pid.isdigit()}
+        now = time.monotonic()
+
+        if self.__lastFullScan is None or now - self.__lastFullScan >= self.fullRescanInterval:
+            full = True
+
+        for pid in set(self.__processInodes) - pids:
+            self.__forgetProcess(pid)
+
+        for pid in pids if full else pids - set(self.__processInodes):
+            self.__scanProcess(pid)
+
+        if full:
+            self.__lastFullScan = now
+
+        return full
+
+    def owner(self, inode):
+        pid = self.__owners.get(inode)
+
+        if pid is None:
+            return None
+
+        return pid, self.__commands.get(pid)
+
+    def routes(self):
+        full = self.refresh()
+        routes = networkRoutes()
+
+        inodes = {route.inode for route in routes if route.inode}
+        missing = inodes - self.__owners.keys() - self.__unowned
+
+        if missing and not full:
+            # sockets opened since their last scan, looked for only in processes already owning sockets: with
+            # connection churn a walk of every process would happen on each call, the others wait for the full rescan
+            for pid in [pid for pid, owned in self.__processInodes.items() if owned]:
+                self.__scanProcess(pid)
+
+        if missing:
+            self.__unowned = inodes - self.__owners.keys()
+
+        for route in routes:
+            if (pid := self.__owners.get(route.inode)) is not None:
+                route.pid = pid
+                route.command = self.__commands.get(pid)
+
+        return routes
+
+def clockSource():
+    __linuxCheck()
+
+    currentClockSource = ''
+    try:
+        with open('/sys/devices/system/clocksource/clocksource0/current_clocksource', 'r') as file:
+            currentClockSource = file.read().strip()
+    except:
+        pass
+
+    availableClockSources = []
+    try:
+        with open('/sys/devices/system/clocksource/clocksource0/available_clocksource', 'r') as file:
+            availableClockSources = file.read().strip().split(' ')
+    except:
+        pass
+
+    return ClockSource(
+        current=currentClockSource,
+        available=availableClockSources
+    )
+
+def biosInfo():
+    __linuxCheck()
+
+    vendor = ''
+    try:
+        with open('/sys/devices/virtual/dmi/id/bios_vendor', 'r') as file:
+            vendor = file.read().strip()
+    except:
+        pass
+
+    release = ''
+    try:
+        with open('/sys/devices/virtual/dmi/id/bios_release', 'r') as file:
+            release = file.read().strip()
+    except:
+        pass
+
+    version = ''
+    try:
+        with open('/sys/devices/virtual/dmi/id/bios_version', 'r') as file:
+            version = file.read().strip()
+    except:
+        pass
+
+    date = ''
+    try:
+        with open('/sys/devices/virtual/dmi/id/bios_date', 'r') as file:
+            date = file.read().strip()
+    except:
+        pass
+
+    return Bios(
+        vendor=vendor,
+        version=version,
+        release=release,
+        date=date
+    )
+
+def motherboardInfo():
+    __linuxCheck()
+
+    name = ''
+    try:
+        with open('/sys/devices/virtual/dmi/id/board_name', 'r') as file:
+            name = file.read().strip()
+    except:
+        pass
+
+    vendor = ''
+    try:
+        with open('/sys/devices/virtual/dmi/id/board_vendor', 'r') as file:
+            vendor = file.read().strip()
+    except:
+        pass
+
+    version = ''
+    try:
         with open('/sys/devices/virtual/dmi/id/board_version', 'r') as file:
             version = file.read().strip()
     except:
         pass
 
-    bios = biosInfo()
-    return Motherboard (
-        name=name,
-        version=version,
-        vendor=vendor,
-        bios=bios
-    )
+    bios = biosInfo()
+    return Motherboard (
+        name=name,
+        version=version,
+        vendor=vendor,
+        bios=bios
+    )
+
+def __bytesToInt(bytes):
+    res = 0
+    shift = 8 * len(bytes)
+
+    if sys.byteorder == 'little':
+        bytes = bytes[::-1]
+
+    for byte in bytes:
+        shift -= 8
+        res += byte << shift
+
+    return res
+
+def gpuMetrics():
+    __linuxCheck()
+
+    try:
+        with open('/sys/class/drm/card0/device/gpu_metrics', 'rb') as file:
+            bytes = file.read()
+
+    except:
+        pass
+
+    if bytes[2] != 1:
+        return None
+
+    content = bytes[3]
+    bytes = bytes[4:]
+
+    return GpuMetrics (
+        temperatureEdge=__bytesToInt(bytes[0:2] if content else bytes[8:10]),
+        temperatureHotspot=__bytesToInt(bytes[2:4] if content else bytes[10:12]),
+        temperatureMem=__bytesToInt(bytes[4:6] if content else bytes[12:14]),
+        temperatureVrgfx=__bytesToInt(bytes[6:8] if content else bytes[14:16]),
+        temperatureVrsoc=__bytesToInt(bytes[8:10] if content else bytes[16:18]),
+        temperatureVrmem=__bytesToInt(bytes[10:12] if content else bytes[18:20]),
+        averageSocketPower=__bytesToInt(bytes[18:20] if content else bytes[26:28]),
+        averageGfxclkFrequency=__bytesToInt(bytes[36:38]),
+        averageSockclkFrequency=__bytesToInt(bytes[38:40]),
+        averageUclkFrequency=__bytesToInt(bytes[40:42]),
+        currentGfxclk=__bytesToInt(bytes[50:52]),
+        currentSockclk=__bytesToInt(bytes[52:54]),
+        throttleStatus=__bytesToInt(bytes[64:68]),
+        currentFanSpeed=__bytesToInt(bytes[68:70]),
+        pcieLinkWidth=__bytesToInt(bytes[70:72]),
+        pcieLinkSpeed=__bytesToInt(bytes[72:74]),
+    )
+
+def nvmeDevices():
+    __linuxCheck()
+
+    baseDir = '/sys/class/nvme'
+
+    try:
+        dirContent = __listDirectory('block', baseDir)
+    except:
+        return []
+
+    devices = []
+    partitions = __deviceAttribute('block', '/proc/partitions').strip()
+    mountPoints = __readFile('/proc/mounts').strip()
+
+    for device in dirContent:
+        address = __deviceAttribute('block', f'{baseDir}/{device}/address').strip()
+        model = __deviceAttribute('block', f'{baseDir}/{device}/model').strip()
+
+        linkSpeed = __readFile(f'{baseDir}/{device}/device/current_link_speed').strip()
+        linkSpeed = float(linkSpeed.split(' ')[0])
+
+        pcieLanes = __readFile(f'{baseDir}/{device}/device/current_link_width').strip()
+        pcieLanes = int(pcieLanes)
+
+        size = 0
+        for partitionLine in partitions.strip().split('\n')[2:]:
+            if device in partitionLine:
+                size = int(partitionLine.split(' ')[-2])
+
+        localPartitions = []
+        for mount in mountPoints.split('\n'):
+
+            if device in mount:
+                splitted = mount.split(' ')
+                device = splitted[0]
+                deviceName = device.split('/')[2]
+
+                mountPoint = splitted[1]
+                filesystem = splitted[2]
+
+                partSize = ByteSize(0)
+                startPoint = 0
+
+                for partition in partitions.split('\n'):
+                    if deviceName in partition:
+                        try:
+                            partSize = ByteSize(
+                                int(
+                                    __deviceAttribute('block', f'/sys/class/block/{deviceName}/size').strip()
+                                )
+                            )
+                        except:
+                            pass
+
+                        try:
+                            startPoint = int(
+                                __deviceAttribute('block', f'/sys/class/block/{deviceName}/start').strip()
+                            )
+                        except:
+                            pass
+
+                        break
+
+                localPartitions.append(StoragePartition(
+                    device=device,
+                    mountPoint=mountPoint,
+                    filesystem=filesystem,
+                    size=partSize,
+                    startPoint=startPoint
+                ))
+
+        devices.append(NvmeDevice(
+            device=device,
+            model=model,
+            pcieAddress=address,
+            linkSpeedGTs=linkSpeed,
+            pcieLanes=pcieLanes,
+            size=ByteSize(size),
+            partitions=localPartitions
+        ))
+
+    return devices
+
+def storageDevices():
+    __linuxCheck()
+
+    baseDir = '/sys/class/block'
+
+    try:
+        dirContent = __listDirectory('block', baseDir)
+    except:
+        return []
+
+    mountPoints = __readFile('/proc/mounts').split('\n')
+
+    devices = []
+    for dir in dirContent:
+        if 'sd' not in dir or len(dir) != 3:
+            continue
+
+        device = f'/dev/{dir}'
+        size = __deviceAttribute('block', f'{baseDir}/{dir}/size').strip()
+
+        try:
+            size = ByteSize(int(size))
+
+        except:
+            size = ByteSize(0)
+
+        model = __deviceAttribute('block', f'{baseDir}/{dir}/device/model').strip()
+        partitions = []
+
+        for partitionDir in dirContent:
+            if dir not in partitionDir:
+                continue
+
+            if len(partitionDir) <= 3:
+                continue
+            
+            partitionSize = __deviceAttribute('block', f'{baseDir}/{partitionDir}/size').strip()
+            partitionSize = ByteSize(int(partitionSize) if partitionSize else 0)
+            
+            startByte = __deviceAttribute('block', f'{baseDir}/{partitionDir}/start').strip()
+            startByte = ByteSize(int(startByte) if startByte else 0)
+
+            mountPoint = ''
+            fileSystem = ''
+
+            for mount in mountPoints:
+                if f'/dev/{partitionDir} ' in mount:
+                    splitted = mount.split(' ')
+
+                    mountPoint = splitted[1]
+                    fileSystem = splitted[2]
+                    break
+
+            partitions.append(
+                StoragePartition(
+                    device=f'/dev/{partitionDir}',
+                    mountPoint=mountPoint,
+                    filesystem=fileSystem,
+                    size=partitionSize,
+                    startPoint=startByte
+                )
+            )
+
+        devices.append(
+            StorageDevice (
+                model=model,
+                device=device,
+                size=size,
+                partitions=partitions
+            )
+        )
+
+    return devices
+
+# nodev filesystems which still hold user data
+__DATA_FILESYSTEMS = (
+    'tmpfs', 'ramfs', 'overlay', 'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'ceph', '9p', 'virtiofs', 'afs', 'zfs'
+)
+
+# hard limit of statvfs threads, hung ones included
+__STATVFS_THREAD_LIMIT = 64
+
+__filesystemTypes = None
+__statvfsState = {}
+
+class __StatvfsJob:
+    def __init__(self, path):
+        self.path = path
+        self.started = None
+        self.done = False
+        self.stuck = False
+
+def __pseudoFilesystems(filesystem):
+    global __filesystemTypes
+
+    # fuse mounts are reported as fuse.<subtype>, /proc/filesystems only lists fuse
+    filesystem = filesystem.partition('.')[0]
+
+    # the filter is rebuilt only when a filesystem registered after the last read shows up
+    if __filesystemTypes is None or filesystem not in __filesystemTypes:
+        types = {}
+
+        for line in __readFile('/proc/filesystems').split('\n'):
+            flags, _, name = line.rpartition('\t')
+
+            if name:
+                types[name] = flags == 'nodev' and name not in __DATA_FILESYSTEMS and not name.startswith('fuse')
+
+        __filesystemTypes = types
+
+    return __filesystemTypes.get(filesystem, False)
+
+def __statvfsWorker():
+    state = __statvfsState
+
+    while True:
+        job = state['queue'].get()
+
+        with state['condition']:
+            job.started = time.monotonic()
+
+        try:
+            result = os.statvfs(job.path)
+        except:
+            result = None
+
+        with state['condition']:
+            # a statvfs which outlived its caller still refreshes the cache for the next one
+            state['pending'].pop(job.path, None)
+            state['results'][job.path] = result
+
+            job.done = True
+            state['condition'].notify_all()
+
+            if job.stuck:
+                state['stuck'] -= 1
+
+            # a worker which was replacing this one while it hung is not needed anymore
+            if state['workers'] - state['stuck'] > state['limit']:
+                state['workers'] -= 1
+                return
+
+def __spawnStatvfsWorkers(state):
+    import threading
+
+    # hung workers do not count against the pool size, so healthy mounts keep being served
+    while state['workers'] - state['stuck'] < state['limit'] and state['workers'] < __STATVFS_THREAD_LIMIT:
+        threading.Thread(target=__statvfsWorker, name='sysutil-statvfs', daemon=True).start()
+        state['workers'] += 1
+
+def __submitStatvfs(path, workers):
+    import queue
+    import threading
+
+    state = __statvfsState
+
+    if not state:
+        state.update(
+            queue=queue.SimpleQueue(),
+            condition=threading.Condition(),
+            pending={},
+            results={},
+            workers=0,
+            stuck=0,
+            limit=workers
+        )
+
+    with state['condition']:
+        # a mount still hanging from a previous call is not queued again
+        job = state['pending'].get(path)
+
+        if job is None:
+            job = __StatvfsJob(path)
+
+            state['pending'][path] = job
+            state['queue'].put(job)
+
+        state['limit'] = workers
+        __spawnStatvfsWorkers(state)
+
+    return job
+
+def __unescapeMount(field):
+    import re
+
+    # /proc/mounts escapes spaces, tabs, newlines and backslashes as octal sequences
+    if '\\' not in field:
+        return field
+
+    return re.sub(r'\\([0-7]{3})', lambda match: chr(int(match.group(1), 8)), field)
+
+def filesystemUsage(timeout=0.2, budget=0.8, workers=8, pseudo=False):
+    __linuxCheck()
+
+    mounts = {}
+
+    for line in __readFile('/proc/mounts').split('\n'):
+        splitted = line.split(' ')
+        if len(splitted) < 3:
+            continue
+
+        device, mountPoint, filesystem = splitted[:3]
+
+        if not pseudo and __pseudoFilesystems(filesystem):
+            continue
+
+        # the last mount on a mount point hides the previous ones
+        mounts[__unescapeMount(mountPoint)] = (__unescapeMount(device), filesystem)
+
+    jobs = [__submitStatvfs(mountPoint, workers) for mountPoint in mounts]
+
+    if not jobs:
+        return []
+
+    state = __statvfsState
+    deadline = time.monotonic() + budget
+
+    with state['condition']:
+        while True:
+            now = time.monotonic()
+
+            for job in jobs:
+                if not job.done and not job.stuck and job.started is not None and now - job.started >= timeout:
+                    job.stuck = True
+                    state['stuck'] += 1
+
+                    __spawnStatvfsWorkers(state)
+
+            # a mount is given up when its statvfs runs longer than the timeout, or the budget runs out
+            waiting = [
+                job for job in jobs if not job.done and (job.started is None or now - job.started < timeout)
+            ]
+
+            if not waiting or now >= deadline:
+                break
+
+            expiries = [job.started + timeout for job in waiting if job.started is not None]
+            state['condition'].wait(min(expiries + [deadline]) - now)
+
+        results = [(job.done, state['results'].get(job.path)) for job in jobs]
+
+    usage = []
+
+    for (mountPoint, (device, filesystem)), (done, result) in zip(mounts.items(), results):
+        if result is None and done:
+            continue
+
+        if result is None:
+            size = free = available = used = None
+            files = freeFiles = None
+
+        else:
+            size = ByteSize(result.f_blocks * result.f_frsize)
+            free = ByteSize(result.f_bfree * result.f_frsize)
+            available = ByteSize(result.f_bavail * result.f_frsize)
+            used = ByteSize((result.f_blocks - result.f_bfree) * result.f_frsize)
+
+            files = result.f_files
+            freeFiles = result.f_ffree
+
+        usage.append(
+            FilesystemUsage(
+                device=device,
+                mountPoint=mountPoint,
+                filesystem=filesystem,
+                size=size,
+                free=free,
+                available=available,
+                used=used,
+                files=files,
+                freeFiles=freeFiles,
+                stale=not done
+            )
+        )
+
+    return usage
+
+def __processorDirectories():
+    DRIVER_DIR = '/sys/devices/system/cpu'
+    processors = []
+
+    for processor in os.listdir(DRIVER_DIR):
+        if processor.startswith('cpu') and processor[3:].isdigit():
+            processors.append((int(processor[3:]), f'{DRIVER_DIR}/{processor}'))
+
+    return sorted(processors)
+
+def __cpuinfoFrequencies():
+    frequencies = []
+
+    fileContent = __readFile('/proc/cpuinfo')
+    for chunk in fileContent.split('\n\n'):
+        if not chunk or chunk == ' ':
+            continue
+
+        id = ''
+        freq = 0
+
+        for line in chunk.split('\n'):
+            if line.startswith('processor'):
+                id = line.split(':')[-1].strip()
+
+            elif line.startswith('cpu MHz'):
+                freq = float(line.split(':')[-1])
+
+        if not id or freq == 0:
+            continue
+
+        frequencies.append(
+            ProcessorFrequency(
+                processorID=id,
+                frequency=Frequency(
+                    _khz=freq * 1000
+                )
+            )
+        )
+
+    return frequencies
+
+def cpuFrequency():
+    __linuxCheck()
+
+    frequencies = []
+
+    for cpuId, path in __processorDirectories():
+        khz = __readInt(f'{path}/cpufreq/scaling_cur_freq')
+
+        if khz is not None:
+            frequencies.append(
+                ProcessorFrequency(
+                    processorID=str(cpuId),
+                    frequency=Frequency(_khz=khz)
+                )
+            )
+
+    policies = []
+    DRIVER_DIR = '/sys/devices/system/cpu/cpufreq'
+
+    if frequencies:
+        for policy in os.listdir(DRIVER_DIR):
+            if not policy.startswith('policy'):
+                continue
+
+            khz = __readInt(f'{DRIVER_DIR}/{policy}/scaling_cur_freq')
+            if khz is None:
+                continue
+
+            policies.append(
+                PolicyFrequency(
+                    name=policy,
+                    cpus=__parseCpuList(__readFile(f'{DRIVER_DIR}/{policy}/affected_cpus').replace(' ', ',')),
+                    frequency=Frequency(_khz=khz)
+                )
+            )
+
+    else:
+        # no cpufreq driver, fall back to the values reported in /proc/cpuinfo
+        frequencies = __cpuinfoFrequencies()
+
+    totalFreq = sum(frequency.frequency.khz() for frequency in frequencies)
+
+    return CpuFrequency(
+        average=Frequency(
+            _khz=totalFreq / len(frequencies) if frequencies else 0
+        ),
+        processors=frequencies,
+        policies=sorted(policies, key=lambda policy: int(policy.name[6:]))
+    )
+
+class FrequencySampler(_DescriptorSampler):
+    def __init__(self):
+        super().__init__()
+
+        self.__processors = []
+        self.__policies = []
+
+        DRIVER_DIR = '/sys/devices/system/cpu'
+
+        for processor in os.listdir(DRIVER_DIR):
+            if not processor.startswith('cpu') or not processor[3:].isdigit():
+                continue
+
+            fd = self._open(f'{DRIVER_DIR}/{processor}/cpufreq/scaling_cur_freq')
+            if fd is None:
+                continue
+
+            self.__processors.append((int(processor[3:]), fd))
+
+        self.__processors.sort()
+
+        if not self.__processors:
+            return
+
+        for policy in os.listdir(f'{DRIVER_DIR}/cpufreq'):
+            if not policy.startswith('policy'):
+                continue
+
+            path = f'{DRIVER_DIR}/cpufreq/{policy}'
+
+            fd = self._open(f'{path}/scaling_cur_freq')
+            if fd is None:
+                continue
+
+            cpus = [int(cpu) for cpu in _readText(f'{path}/affected_cpus').split()]
+
+            self.__policies.append((int(policy[6:]), policy, cpus, fd))
+
+        self.__policies.sort()
+
+    def close(self):
+        super().close()
+
+        self.__processors = []
+        self.__policies = []
+
+    def update(self):
+        if not self.__processors:
+            # no cpufreq driver, nothing to keep open
+            return cpuFrequency()
+
+        frequencies = []
+        totalFreq = 0
+
+        for cpuId, fd in self.__processors:
+            khz = self._value(fd)
+
+            if khz is None:
+                # offlined processor (ENODEV) or empty read
+                continue
+
+            totalFreq += khz
+
+            frequencies.append(
+                ProcessorFrequency(
+                    processorID=str(cpuId),
+                    frequency=Frequency(_khz=khz)
+                )
+            )
+
+        policies = []
+        for _, name, cpus, fd in self.__policies:
+            khz = self._value(fd)
+            if khz is None:
+                continue
+
+            policies.append(
+                PolicyFrequency(
+                    name=name,
+                    cpus=cpus,
+                    frequency=Frequency(_khz=khz)
+                )
+            )
+
+        return CpuFrequency(
+            average=Frequency(_khz=totalFreq / len(frequencies) if frequencies else 0),
+            processors=frequencies,
+            policies=policies
+        )
+
+def getBacklight():
+    baseDir = '/sys/class/backlight'
+    dirs = os.listdir(baseDir)
+    path = ''
+
+    for dir in dirs:
+        dirPath = os.path.join(baseDir, dir)
+        if os.path.exists(os.path.join(dirPath, 'brightness')) and os.path.exists(os.path.join(dirPath, 'max_brightness')):
+            path = dirPath
+            break
+
+    if not path:
+        return None
+
+    with open(os.path.join(path, 'brightness'), 'r') as file:
+        brightness = int(file.read().strip().replace(',', '.'))
+
+    with open(os.path.join(path, 'max_brightness'), 'r') as file:
+        maxBrightness = int(file.read().strip().replace(',', '.'))
+
+    return Backlight(brightness, maxBrightness)
+
+def getLoad():
+    with open('/proc/loadavg', 'r') as file:
+        content = file.read()
+
+    splitted = content.split(' ')
+    return Load(
+        oneMinute=float(splitted[0]),
+        fiveMinutes=float(splitted[1]),
+        fifteenMinutes=float(splitted[2])
+    )
+
+def __parsePressure(content):
+    records = {}
+
+    for line in content.strip().split('\n'):
+        if not line:
+            continue
+
+        kind, *values = line.split(' ')
+        parsed = {}
+
+        for value in values:
+            key, number = value.split('=')
+            parsed[key] = number
+
+        try:
+            records[kind] = PressureRecord(
+                avg10=float(parsed['avg10']),
+                avg60=float(parsed['avg60']),
+                avg300=float(parsed['avg300']),
+                total=int(parsed['total'])
+            )
+        except:
+            continue
+
+    if not records:
+        return None
+
+    return Pressure(
+        some=records.get('some'),
+        full=records.get('full')
+    )
+
+def pressureInfo():
+    __linuxCheck()
+
+    baseDir = '/proc/pressure'
+
+    return SystemPressure(
+        cpu=__parsePressure(__readFile(f'{baseDir}/cpu')),
+        memory=__parsePressure(__readFile(f'{baseDir}/memory')),
+        io=__parsePressure(__readFile(f'{baseDir}/io'))
+    )
+
+class PressureSampler:
+    def __init__(self):
+        self.__last = pressureInfo()
+        self.__lastTime = time.monotonic()
+
+    @staticmethod
+    def __stallPercentage(before, after, elapsed):
+        if before is None or after is None:
+            return None
+
+        return (after.total - before.total) * 100 / elapsed
+
+    def __stall(self, before, after, elapsed):
+        if before is None or after is None:
+            return None
+
+        return PressureStall(
+            some=self.__stallPercentage(before.some, after.some, elapsed),
+            full=self.__stallPercentage(before.full, after.full, elapsed)
+        )
+
+    def update(self):
+        current = pressureInfo()
+        now = time.monotonic()
+
+        interval = now - self.__lastTime
+        elapsed = interval * 1000_000
+
+        if elapsed <= 0:
+            return None
+
+        rate = PressureRate(
+            cpu=self.__stall(self.__last.cpu, current.cpu, elapsed),
+            memory=self.__stall(self.__last.memory, current.memory, elapsed),
+            io=self.__stall(self.__last.io, current.io, elapsed),
+            interval=interval
+        )
+
+        self.__last = current
+        self.__lastTime = now
+
+        return rate
+
+def __bitsToByte(bits):
+    reversed = bits[::-1]
+    byte = 0
+
+    for index, bit in enumerate(reversed):
+        byte += bit * (2 ** index)
+
+    return byte
+
+def __netmaskFromCidr(cidr):
+    bits = []
+
+    for i in range(32):
+        if i < int(cidr):
+            bits.append(1)
+
+        else:
+            bits.append(0)
+
+    mask = []
+    i = 0
+    while i < 32:
+        mask.append(__bitsToByte(bits[i:i+8]))
+        i += 8
+
+    return f'{mask[0]}.{mask[1]}.{mask[2]}.{mask[3]}'
+
+class RouteNetlink:
+    RTMGRP_LINK = 0x1
+    RTMGRP_IPV4_IFADDR = 0x10
+    RTMGRP_IPV6_IFADDR = 0x100
+
+    RTM_NEWLINK = 16
+    RTM_DELLINK = 17
+    RTM_GETLINK = 18
+    RTM_NEWADDR = 20
+    RTM_DELADDR = 21
+    RTM_GETADDR = 22
+
+    NLMSG_ERROR = 2
+    NLMSG_DONE = 3
+
+    NLM_F_REQUEST = 0x1
+    NLM_F_DUMP = 0x300
+
+    IFA_ADDRESS = 1
+    IFA_LOCAL = 2
+    IFA_LABEL = 3
+    IFA_BROADCAST = 4
+
+    IFLA_ADDRESS = 1
+    IFLA_IFNAME = 3
+    IFLA_MTU = 4
+    IFLA_OPERSTATE = 16
+
+    IFF_UP = 0x1
+
+    OPERATIONAL_STATES = ('unknown', 'notpresent', 'down', 'lowerlayerdown', 'testing', 'dormant', 'up')
+
+    # rtnetlink address scopes
+    SCOPES = {0 : 'global', 200 : 'site', 253 : 'link', 254 : 'host', 255 : 'nowhere'}
+
+    __HEADER = '=IHHII'
+    __HEADER_SIZE = 16
+    __BUFFER_SIZE = 1 << 17
+
+    def __init__(self, groups=0):
+        import socket
+
+        self.__socket = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        self.__socket.bind((0, groups))
+        self.__sequence = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def fileno(self):
+        return self.__socket.fileno()
+
+    def setblocking(self, blocking):
+        self.__socket.setblocking(blocking)
+
+    def close(self):
+        self.__socket.close()
+
+    def receive(self):
+        import struct
+
+        data = self.__socket.recv(self.__BUFFER_SIZE)
+        messages = []
+        offset = 0
+
+        while offset + self.__HEADER_SIZE <= len(data):
+            length, messageType, _, sequence, _ = struct.unpack_from(self.__HEADER, data, offset)
+            if length < self.__HEADER_SIZE:
+                break
+
+            messages.append((messageType, sequence, data[offset + self.__HEADER_SIZE:offset + length]))
+            offset += (length + 3) & ~3
+
+        return messages
+
+    def dump(self, messageType, payload):
+        import struct
+
+        self.__sequence += 1
+        header = struct.pack(
+            self.__HEADER,
+            self.__HEADER_SIZE + len(payload),
+            messageType,
+            self.NLM_F_REQUEST | self.NLM_F_DUMP,
+            self.__sequence,
+            0
+        )
+        self.__socket.send(header + payload)
+
+        messages = []
+        while True:
+            for responseType, sequence, response in self.receive():
+                if sequence != self.__sequence:
+                    # multicast notification received while dumping
+                    continue
+
+                if responseType == self.NLMSG_DONE:
+                    return messages
+
+                if responseType == self.NLMSG_ERROR:
+                    error = -struct.unpack_from('=i', response)[0]
+                    if error:
+                        raise OSError(error, os.strerror(error))
+                    continue
+
+                messages.append((responseType, response))
+
+    @staticmethod
+    def attributes(data, offset):
+        import struct
+
+        attributes = {}
+
+        while offset + 4 <= len(data):
+            length, attributeType = struct.unpack_from('=HH', data, offset)
+            if length < 4:
+                break
+
+            attributes[attributeType & 0x3fff] = data[offset + 4:offset + length]
+            offset += (length + 3) & ~3
+
+        return attributes
+
+    @staticmethod
+    def interfaceName(index, names=None):
+        import socket
+
+        if names is not None and index in names:
+            return names[index]
+
+        try:
+            name = socket.if_indextoname(index)
+        except OSError:
+            name = None
+
+        if names is not None:
+            names[index] = name
+
+        return name
+
+    @classmethod
+    def parseAddress(cls, payload, names=None):
+        import socket
+        import struct
+
+        family, prefixLength, _, scope, index = struct.unpack_from('=BBBBI', payload)
+
+        if family == socket.AF_INET:
+            addressFamily = AddressFamily.IPV4
+        elif family == socket.AF_INET6:
+            addressFamily = AddressFamily.IPV6
+        else:
+            return None
+
+        attributes = cls.attributes(payload, 8)
+
+        # IFA_ADDRESS is the peer address on point-to-point links, IFA_LOCAL the local one
+        address = attributes.get(cls.IFA_LOCAL, attributes.get(cls.IFA_ADDRESS))
+        if address is None:
+            return None
+
+        label = attributes.get(cls.IFA_LABEL)
+        broadcast = attributes.get(cls.IFA_BROADCAST)
+
+        return IPAddress(
+            address=socket.inet_ntop(family, address),
+            interface=label.rstrip(b'\0').decode() if label else cls.interfaceName(index, names),
+            family=addressFamily,
+            prefixLength=prefixLength,
+            broadcast=socket.inet_ntop(family, broadcast) if broadcast else None,
+            scope=cls.SCOPES.get(scope, str(scope))
+        )
+
+    @classmethod
+    def parseLink(cls, payload):
+        import struct
+
+        _, _, index, flags, _ = struct.unpack_from('=BxHiII', payload)
+        attributes = cls.attributes(payload, 16)
+
+        name = attributes.get(cls.IFLA_IFNAME, b'').rstrip(b'\0').decode()
+        mac = attributes.get(cls.IFLA_ADDRESS, b'')
+        mtu = attributes.get(cls.IFLA_MTU)
+        state = attributes.get(cls.IFLA_OPERSTATE)
+
+        if state:
+            state = state[0]
+            state = cls.OPERATIONAL_STATES[state] if state < len(cls.OPERATIONAL_STATES) else str(state)
+
+        return NetworkLink(
+            index=index,
+            name=name,
+            macAddress=':'.join(f'{byte:02x}' for byte in mac),
+            mtu=struct.unpack('=I', mtu)[0] if mtu else None,
+            operationalState=state,
+            up=bool(flags & cls.IFF_UP)
+        )
+
+class _SocketWatcher(abc.ABC):
+    # subscribers and polling thread shared by the watchers reading events from a netlink socket
+    _THREAD_NAME = None
+
+    def __init__(self, socket):
+        self._socket = socket
+        self.__callbacks = []
+        self.__thread = None
+        self.__running = False
+
+        # exception which stopped the polling thread
+        self.error = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @abc.abstractmethod
+    def _process(self):
+        # reads the pending messages, dispatches and returns the resulting events
+        pass
+
+    def _dispatch(self, events):
+        for event in events:
+            for callback in list(self.__callbacks):
+                callback(event)
+
+        return events
+
+    def subscribe(self, callback):
+        self.__callbacks.append(callback)
+
+    def unsubscribe(self, callback):
+        self.__callbacks.remove(callback)
+
+    def fileno(self):
+        return self._socket.fileno()
+
+    def poll(self, timeout=None):
+        import select
+
+        readable, _, _ = select.select([self._socket], [], [], timeout)
+        if not readable:
+            return []
+
+        return self._process()
+
+    def start(self, onStop=None):
+        import threading
+
+        if self.__thread is not None:
+            return
+
+        self.error = None
+        self.__running = True
+        self.__thread = threading.Thread(target=self.__run, args=(onStop,), name=self._THREAD_NAME, daemon=True)
+        self.__thread.start()
+
+    def __run(self, onStop):
+        try:
+            while self.__running:
+                self.poll(0.5)
+
+        except Exception as error:
+            if not self.__running:
+                # socket closed by close() while waiting
+                return
+
+            # socket error or failing callback, no event will be delivered any more
+            self.__running = False
+            self.error = error
+
+            if onStop is not None:
+                onStop(error)
+
+    def stop(self):
+        self.__running = False
+
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def close(self):
+        self.stop()
+        self._socket.close()
+
+class NetworkWatcher(_SocketWatcher):
+    GROUPS = RouteNetlink.RTMGRP_LINK | RouteNetlink.RTMGRP_IPV4_IFADDR | RouteNetlink.RTMGRP_IPV6_IFADDR
+
+    _THREAD_NAME = 'sysutil-network-watcher'
+
+    def __init__(self):
+        # subscribe before dumping the current state, so no change can be missed in between
+        super().__init__(RouteNetlink(self.GROUPS))
+
+        self.links = {}
+        self.addresses = {}
+
+        self.__synchronize(emit=False)
+
+    @staticmethod
+    def __addressKey(address):
+        return address.interface, address.address, address.prefixLength
+
+    def __names(self):
+        return {index : link.name for index, link in self.links.items()}
 
-def __bytesToInt(bytes):
-    res = 0
-    shift = 8 * len(bytes)
+    def __synchronize(self, emit=True):
+        import socket
+        import struct
 
-    if sys.byteorder == 'little':
-        bytes = bytes[::-1]
+        links = {}
+        addresses = {}
 
-    for byte in bytes:
-        shift -= 8
-        res += byte << shift
+        with RouteNetlink() as netlink:
+            for messageType, payload in netlink.dump(RouteNetlink.RTM_GETLINK, struct.pack('=BxHiII', socket.AF_UNSPEC, 0, 0, 0, 0)):
+                if messageType == RouteNetlink.RTM_NEWLINK:
+                    link = RouteNetlink.parseLink(payload)
+                    links[link.index] = link
 
-    return res
+            names = {index : link.name for index, link in links.items()}
 
-def gpuMetrics():
-    __linuxCheck()
+            for messageType, payload in netlink.dump(RouteNetlink.RTM_GETADDR, struct.pack('=BBBBI', socket.AF_UNSPEC, 0, 0, 0, 0)):
+                if messageType == RouteNetlink.RTM_NEWADDR:
+                    if (address := RouteNetlink.parseAddress(payload, names)) is not None:
+                        addresses[self.__addressKey(address)] = address
 
-    try:
-        with open('/sys/class/drm/card0/device/gpu_metrics', 'rb') as file:
-            bytes = file.read()
+        events = []
 
-    except:
-        pass
+        if emit:
+            for index, link in links.items():
+                if self.links.get(index) != link:
+                    events.append(NetworkEvent(eventType=NetworkEventType.LINK_UPDATED, link=link, address=None))
 
-    if bytes[2] != 1:
-        return None
+            for index, link in self.links.items():
+                if index not in links:
+                    events.append(NetworkEvent(eventType=NetworkEventType.LINK_REMOVED, link=link, address=None))
 
-    content = bytes[3]
-    bytes = bytes[4:]
+            for key, address in addresses.items():
+                if key not in self.addresses:
+                    events.append(NetworkEvent(eventType=NetworkEventType.ADDRESS_ADDED, link=None, address=address))
 
-    return GpuMetrics (
-        temperatureEdge=__bytesToInt(bytes[0:2] if content else bytes[8:10]),
-        temperatureHotspot=__bytesToInt(bytes[2:4] if content else bytes[10:12]),
-        temperatureMem=__bytesToInt(bytes[4:6] if content else bytes[12:14]),
-        temperatureVrgfx=__bytesToInt(bytes[6:8] if content else bytes[14:16]),
-        temperatureVrsoc=__bytesToInt(bytes[8:10] if content else bytes[16:18]),
-        temperatureVrmem=__bytesToInt(bytes[10:12] if content else bytes[18:20]),
-        averageSocketPower=__bytesToInt(bytes[18:20] if content else bytes[26:28]),
-        averageGfxclkFrequency=__bytesToInt(bytes[36:38]),
-        averageSockclkFrequency=__bytesToInt(bytes[38:40]),
-        averageUclkFrequency=__bytesToInt(bytes[40:42]),
-        currentGfxclk=__bytesToInt(bytes[50:52]),
-        currentSockclk=__bytesToInt(bytes[52:54]),
-        throttleStatus=__bytesToInt(bytes[64:68]),
-        currentFanSpeed=__bytesToInt(bytes[68:70]),
-        pcieLinkWidth=__bytesToInt(bytes[70:72]),
-        pcieLinkSpeed=__bytesToInt(bytes[72:74]),
-    )
+            for key, address in self.addresses.items():
+                if key not in addresses:
+                    events.append(NetworkEvent(eventType=NetworkEventType.ADDRESS_REMOVED, link=None, address=address))
 
-def nvmeDevices():
-    __linuxCheck()
+        self.links = links
+        self.addresses = addresses
 
-    baseDir = '/sys/class/nvme'
+        return events
 
-    try:
-        dirContent = os.listdir(baseDir)
-    except:
-        return []
+    def _process(self):
+        import errno
 
-    devices = []
-    partitions = __readFile('/proc/partitions').strip()
-    mountPoints = __readFile('/proc/mounts').strip()
+        try:
+            messages = self._socket.receive()
 
-    for device in dirContent:
-        address = __readFile(f'{baseDir}/{device}/address').strip()
-        model = __readFile(f'{baseDir}/{device}/model').strip()
+        except BlockingIOError:
+            return []
 
-        linkSpeed = __readFile(f'{baseDir}/{device}/device/current_link_speed').strip()
-        linkSpeed = float(linkSpeed.split(' ')[0])
+        except OSError as error:
+            if error.errno != errno.ENOBUFS:
+                raise
 
-        pcieLanes = __readFile(f'{baseDir}/{device}/device/current_link_width').strip()
-        pcieLanes = int(pcieLanes)
+            # the kernel dropped notifications, the tables must be read again
+            _invalidateInterfaces()
+            return self._dispatch(self.__synchronize())
 
-        size = 0
-        for partitionLine in partitions.strip().split('\n')[2:]:
-            if device in partitionLine:
-                size = int(partitionLine.split(' ')[-2])
+        events = []
 
-        localPartitions = []
-        for mount in mountPoints.split('\n'):
+        for messageType, _, payload in messages:
+            if messageType == RouteNetlink.RTM_NEWLINK:
+                link = RouteNetlink.parseLink(payload)
 
-            if device in mount:
-                splitted = mount.split(' ')
-                device = splitted[0]
-                deviceName = device.split('/')[2]
+                # speed, duplex and master are not part of the message, the cached interface is read again
+                _invalidateInterfaces(link.name)
 
-                mountPoint = splitted[1]
-                filesystem = splitted[2]
+                if self.links.get(link.index) != link:
+                    self.links[link.index] = link
+                    events.append(NetworkEvent(eventType=NetworkEventType.LINK_UPDATED, link=link, address=None))
 
-                partSize = ByteSize(0)
-                startPoint = 0
+            elif messageType == RouteNetlink.RTM_DELLINK:
+                link = RouteNetlink.parseLink(payload)
+                self.links.pop(link.index, None)
+                _invalidateInterfaces(link.name)
 
-                for partition in partitions.split('\n'):
-                    if deviceName in partition:
-                        try:
-                            partSize = ByteSize(
-                                int(
-                                    __readFile(f'/sys/class/block/{deviceName}/size').strip()
-                                )
-                            )
-                        except:
-                            pass
+                events.append(NetworkEvent(eventType=NetworkEventType.LINK_REMOVED, link=link, address=None))
 
-                        try:
-                            startPoint = int(
-                                __readFile(f'/sys/class/block/{deviceName}/start').strip()
-                            )
-                        except:
-                            pass
+            elif messageType in (RouteNetlink.RTM_NEWADDR, RouteNetlink.RTM_DELADDR):
+                address = RouteNetlink.parseAddress(payload, self.__names())
+                if address is None:
+                    continue
 
-                        break
+                key = self.__addressKey(address)
 
-                localPartitions.append(StoragePartition(
-                    device=device,
-                    mountPoint=mountPoint,
-                    filesystem=filesystem,
-                    size=partSize,
-                    startPoint=startPoint
-                ))
+                if messageType == RouteNetlink.RTM_NEWADDR:
+                    if key in self.addresses:
+                        self.addresses[key] = address
+                        continue
 
-        devices.append(NvmeDevice(
-            device=device,
-            model=model,
-            pcieAddress=address,
-            linkSpeedGTs=linkSpeed,
-            pcieLanes=pcieLanes,
-            size=ByteSize(size),
-            partitions=localPartitions
-        ))
+                    self.addresses[key] = address
+                    events.append(NetworkEvent(eventType=NetworkEventType.ADDRESS_ADDED, link=None, address=address))
 
-    return devices
+                else:
+                    self.addresses.pop(key, None)
+                    events.append(NetworkEvent(eventType=NetworkEventType.ADDRESS_REMOVED, link=None, address=address))
 
-def storageDevices():
-    __linuxCheck()
+        return self._dispatch(events)
 
-    baseDir = '/sys/class/block'
+    def interfaces(self):
+        return list(self.links.values())
 
-    try:
-        dirContent = os.listdir(baseDir)
-    except:
-        return []
+    def ipAddresses(self):
+        return list(self.addresses.values())
 
-    mountPoints = __readFile('/proc/mounts').split('\n')
+    async def events(self):
+        import asyncio
 
-    devices = []
-    for dir in dirContent:
-        if 'sd' not in dir or len(dir) != 3:
-            continue
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
 
-        device = f'/dev/{dir}'
-        size = __readFile(f'{baseDir}/{dir}/size').strip()
+        def ready():
+            for event in self._process():
+                queue.put_nowait(event)
+
+        self._socket.setblocking(False)
+        loop.add_reader(self._socket.fileno(), ready)
 
         try:
-            size = ByteSize(int(size))
+            while True:
+                yield await queue.get()
 
-        except:
-            size = ByteSize(0)
+        finally:
+            loop.remove_reader(self._socket.fileno())
+            self._socket.setblocking(True)
 
-        model = __readFile(f'{baseDir}/{dir}/device/model').strip()
-        partitions = []
+class HotplugMonitor(_SocketWatcher):
+    NETLINK_KOBJECT_UEVENT = 15
 
-        for partitionDir in dirContent:
-            if dir not in partitionDir:
-                continue
+    # multicast group of the events sent by the kernel (udev rebroadcasts on group 2)
+    KERNEL_GROUP = 1
 
-            if len(partitionDir) <= 3:
-                continue
-            
-            partitionSize = __readFile(f'{baseDir}/{partitionDir}/size').strip()
-            partitionSize = ByteSize(int(partitionSize) if partitionSize else 0)
-            
-            startByte = __readFile(f'{baseDir}/{partitionDir}/start').strip()
-            startByte = ByteSize(int(startByte) if startByte else 0)
+    __BUFFER_SIZE = 1 << 16
+    __RECEIVE_BUFFER = 1 << 20
 
-            mountPoint = ''
-            fileSystem = ''
+    _THREAD_NAME = 'sysutil-hotplug-monitor'
 
-            for mount in mountPoints:
-                if f'/dev/{partitionDir} ' in mount:
-                    splitted = mount.split(' ')
+    def __init__(self):
+        import socket
 
-                    mountPoint = splitted[1]
-                    fileSystem = splitted[2]
-                    break
+        uevents = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, self.NETLINK_KOBJECT_UEVENT)
 
-            partitions.append(
-                StoragePartition(
-                    device=f'/dev/{partitionDir}',
-                    mountPoint=mountPoint,
-                    filesystem=fileSystem,
-                    size=partitionSize,
-                    startPoint=startByte
-                )
-            )
+        try:
+            # events come in bursts when devices with many partitions or queues are plugged
+            uevents.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.__RECEIVE_BUFFER)
+        except OSError:
+            pass
 
-        devices.append(
-            StorageDevice (
-                model=model,
-                device=device,
-                size=size,
-                partitions=partitions
-            )
-        )
+        uevents.bind((0, self.KERNEL_GROUP))
 
-    return devices
+        super().__init__(uevents)
 
-def cpuFrequency():
-    __linuxCheck()
+    @staticmethod
+    def parse(message):
+        header, *fields = message.rstrip(b'\0').split(b'\0')
 
-    totalFreq = 0
-    frequencies = []
+        action, at, devicePath = header.decode(errors='replace').partition('@')
+        if not at:
+            return None
 
-    fileContent = __readFile('/proc/cpuinfo')
-    for chunk in fileContent.split('\n\n'):
-        if not chunk or chunk == ' ':
-            continue
+        properties = {}
+        for field in fields:
+            key, equal, value = field.decode(errors='replace').partition('=')
 
-        id = ''
-        freq = 0
+            if equal:
+                properties[key] = value
 
-        for line in chunk.split('\n'):
-            if 'processor' in line:
-                id = line.strip().split(':')[-1]
+        return UEvent(
+            action=properties.get('ACTION', action),
+            subsystem=properties.get('SUBSYSTEM', ''),
+            devicePath=properties.get('DEVPATH', devicePath),
+            properties=properties
+        )
 
-            elif 'cpu MHz' in line:
-                freq = float(line.strip().split(':')[-1])
+    def _process(self):
+        import errno
 
-        if not id or freq == 0:
-            continue
+        try:
+            message = self._socket.recv(self.__BUFFER_SIZE)
 
-        totalFreq += freq * 1000
-        frequencies.append(
-            ProcessorFrequency(
-                processorID=id,
-                frequency=Frequency(
-                    _khz=freq * 1000
-                )
-            )
-        )
+        except BlockingIOError:
+            return []
 
-    return CpuFrequency(
-        average=Frequency(
-            _khz=totalFreq * 1000 / len(frequencies)
-        ),
-        processors=frequencies
-    )
+        except OSError as error:
+            if error.errno != errno.ENOBUFS:
+                raise
 
-def getBacklight():
-    baseDir = '/sys/class/backlight'
-    dirs = os.listdir(baseDir)
-    path = ''
+            # events were dropped, subscribers receive None and must assume anything changed
+            self._dispatch([None])
+            return []
 
-    for dir in dirs:
-        dirPath = os.path.join(baseDir, dir)
-        if os.path.exists(os.path.join(dirPath, 'brightness')) and os.path.exists(os.path.join(dirPath, 'max_brightness')):
-            path = dirPath
-            break
+        event = self.parse(message)
+        if event is None:
+            return []
 
-    if not path:
-        return None
+        return self._dispatch([event])
 
-    with open(os.path.join(path, 'brightness'), 'r') as file:
-        brightness = int(file.read().strip().replace(',', '.'))
+def enableHotplugCache():
+    global __hotplugMonitor
 
-    with open(os.path.join(path, 'max_brightness'), 'r') as file:
-        maxBrightness = int(file.read().strip().replace(',', '.'))
+    if __hotplugMonitor is not None:
+        return
 
-    return Backlight(brightness, maxBrightness)
+    def stopped(error):
+        global __hotplugMonitor
 
-def getLoad():
-    with open('/proc/loadavg', 'r') as file:
-        content = file.read()
+        # the cache would never be invalidated again, discovery goes back to listing sysfs
+        if __hotplugMonitor is monitor:
+            __hotplugMonitor = None
+            __invalidateDiscovery(None)
 
-    splitted = content.split(' ')
-    return Load(
-        oneMinute=splitted[0],
-        fiveMinutes=splitted[1],
-        fifteenMinutes=splitted[2]
-    )
+    monitor = HotplugMonitor()
+    monitor.subscribe(__invalidateDiscovery)
+    monitor.start(onStop=stopped)
 
-def __containsAddress(addresses, address):
-    for addr, broadcast, netmask, cidr in addresses:
-        if addr == address:
-            return True
-    return False
+    # anything discovered before the monitor was listening may be outdated
+    __invalidateDiscovery(None)
+    __hotplugMonitor = monitor
 
-def __bitsToByte(bits):
-    reversed = bits[::-1]
-    byte = 0
+def disableHotplugCache():
+    global __hotplugMonitor
 
-    for index, bit in enumerate(reversed):
-        byte += bit * (2 ** index)
+    monitor = __hotplugMonitor
+    __hotplugMonitor = None
 
-    return byte
+    if monitor is not None:
+        monitor.close()
 
-def __netmaskFromCidr(cidr):
-    bits = []
+    __invalidateDiscovery(None)
 
-    for i in range(32):
-        if i < int(cidr):
-            bits.append(1)
+def __netlinkAddresses():
+    import socket
+    import struct
 
-        else:
-            bits.append(0)
+    addresses = []
+    names = {}
 
-    mask = []
-    i = 0
-    while i < 32:
-        mask.append(__bitsToByte(bits[i:i+8]))
-        i += 8
+    with RouteNetlink() as netlink:
+        request = struct.pack('=BBBBI', socket.AF_UNSPEC, 0, 0, 0, 0)
 
-    return f'{mask[0]}.{mask[1]}.{mask[2]}.{mask[3]}'
+        for messageType, payload in netlink.dump(RouteNetlink.RTM_GETADDR, request):
+            if messageType != RouteNetlink.RTM_NEWADDR:
+                continue
 
-def getIPv4():
-    ipv4Addresses = []
+            if (address := RouteNetlink.parseAddress(payload, names)) is not None:
+                addresses.append(address)
+
+    return addresses
+
+def __routeHexToInt(value):
+    # /proc/net/route prints addresses as host-endian hexadecimal
+    return int.from_bytes(int(value, 16).to_bytes(4, sys.byteorder), 'big')
+
+# scope bits of /proc/net/if_inet6
+__INET6_SCOPES = {0x00 : 'global', 0x10 : 'host', 0x20 : 'link', 0x40 : 'site'}
+
+def __procfsAddresses():
+    import socket
 
-    interfaces = []
     addresses = []
 
-    routes = __readFile("/proc/net/route")
-    fibTrie = __readFile("/proc/net/fib_trie")
+    localAddresses = []
+    seen = set()
+    previous = ''
+
+    # host scoped local prefixes (127.0.0.0/8) are routed to the loopback interface, they have no /proc/net/route entry
+    loopbackNetworks = {}
+
+    for line in __readFile('/proc/net/fib_trie').split('\n'):
+        line = line.strip()
 
-    index = 0
-    lines = fibTrie.split('|--')
+        if line.startswith('|--'):
+            previous = line[3:].strip()
 
-    while index < len(lines):
-        line = lines[index]
-        chunks = line.split('\n')
+        elif line == '/32 host LOCAL':
+            if previous not in seen:
+                seen.add(previous)
+                localAddresses.append(previous)
 
-        address = chunks[0].strip()
-        addressType = chunks[1].strip()
+        elif line.endswith(' host LOCAL') and line[1:].split()[0].isdigit():
+            prefixLength = int(line[1:].split()[0])
+            mask = (0xffffffff << (32 - prefixLength)) & 0xffffffff
 
-        if '/32 host LOCAL' in addressType and not __containsAddress(addresses, address):
-            broadcast = lines[index+1].split('\n')[0].strip()
-            cidr = lines[index-1].split('\n')[1].strip().split(' ')[0].replace('/', '').strip()
+            loopbackNetworks[(int.from_bytes(socket.inet_aton(previous), 'big') & mask, mask)] = 'lo'
 
-            mask = __netmaskFromCidr(cidr)
-            addresses.append((address, broadcast, cidr, mask))
+    networks = {}
+    for line in __readFile('/proc/net/route').split('\n')[1:]:
+        chunks = line.split()
+        if len(chunks) < 8:
+            continue
+
+        mask = __routeHexToInt(chunks[7])
+        if mask:
+            networks.setdefault((__routeHexToInt(chunks[1]), mask), chunks[0])
+
+    for network, interface in loopbackNetworks.items():
+        networks.setdefault(network, interface)
+
+    masks = sorted({mask for _, mask in networks}, reverse=True)
 
-        index += 1
+    for address in localAddresses:
+        value = int.from_bytes(socket.inet_aton(address), 'big')
+
+        for mask in masks:
+            if (interface := networks.get((value & mask, mask))) is None:
+                continue
+
+            prefixLength = bin(mask).count('1')
+            loopback = interface == 'lo'
+            broadcast = None
+
+            if prefixLength < 31 and not loopback:
+                broadcast = socket.inet_ntoa(((value | ~mask) & 0xffffffff).to_bytes(4, 'big'))
+
+            addresses.append(IPAddress(
+                address=address,
+                interface=interface,
+                family=AddressFamily.IPV4,
+                prefixLength=prefixLength,
+                broadcast=broadcast,
+                scope='host' if loopback else 'global'
+            ))
+            break
 
-    for line in routes.split('\n'):
-        if not line or 'Gateway' in line:
+    for line in __readFile('/proc/net/if_inet6').split('\n'):
+        chunks = line.split()
+        if len(chunks) < 6:
             continue
 
-        splittedLine = line.split('\t')
-        device = splittedLine[0].strip()
+        scope = int(chunks[3], 16)
 
-        network = __bytesToAddress(splittedLine[1], '.')
-        ip = None
-        brd = None
+        addresses.append(IPAddress(
+            address=socket.inet_ntop(socket.AF_INET6, bytes.fromhex(chunks[0])),
+            interface=chunks[5],
+            family=AddressFamily.IPV6,
+            prefixLength=int(chunks[2], 16),
+            broadcast=None,
+            scope=__INET6_SCOPES.get(scope, str(scope))
+        ))
+
+    return addresses
+
+def ipAddresses():
+    __linuxCheck()
 
-        mask = None
-        cidr = None
+    try:
+        return __netlinkAddresses()
+
+    except OSError:
+        # netlink sockets may be forbidden by seccomp or sandboxing, fall back to procfs
+        return __procfsAddresses()
 
-        for address, broadcast, cidrAddr, netmask in addresses:
-            addressNetwork = address.strip().split('.')
+def getIPv4():
+    __linuxCheck()
 
-            addressNetwork[3] = '0'
-            addressNetwork = '.'.join(addressNetwork)
+    ipv4Addresses = []
 
-            if network == addressNetwork:
-                ip = address
-                brd = broadcast
-                cidr = cidrAddr
-                mask = netmask
+    for address in ipAddresses():
+        if address.family != AddressFamily.IPV4:
+            continue
 
-        if ip is not None:
-            ipv4Addresses.append(
-                IPv4(
-                    address=ip.strip(),
-                    interface=device,
-                    broadcast=brd,
-                    cidr=cidr,
-                    netmask=mask
-                ))
+        ipv4Addresses.append(
+            IPv4(
+                address=address.address,
+                interface=address.interface,
+                broadcast=address.broadcast,
+                cidr=address.prefixLength,
+                netmask=__netmaskFromCidr(address.prefixLength)
+            ))
 
     return ipv4Addresses
 
 def busInput():
+    return list(__discovered('input', 'devices', __busInputs))
+
+def __busInputs():
     inputs = []
 
     with open('/proc/bus/input/devices', 'r') as file:
@@ -1413,27 +4274,609 @@ def busInput():
 
     return inputs
 
-def networkInterfaces():
+# name -> attributes of each interface, read again only on refresh, on a net hotplug event or a link notification
+__interfaceCache = {}
+__interfaceGeneration = 0
+
+def _invalidateInterfaces(name=None):
+    # called by NetworkWatcher on rtnetlink link notifications and on net hotplug events
+    global __interfaceGeneration
+
+    __interfaceGeneration += 1
+
+    if name is None:
+        __interfaceCache.clear()
+    else:
+        __interfaceCache.pop(name, None)
+
+def __interfaceAttributes(path):
+    interfaceType = InterfaceType.VIRTUAL
+    directoryContent = os.listdir(path)
+
+    if 'phydev' in directoryContent or 'phy80211' in directoryContent:
+         interfaceType = InterfaceType.PHYSICAL
+
+    driver = None
+    try:
+        driver = os.path.basename(os.readlink(f'{path}/device/driver'))
+    except:
+        pass
+
+    rxQueues = 0
+    txQueues = 0
+
+    try:
+        for queue in os.listdir(f'{path}/queues'):
+            if queue.startswith('rx-'):
+                rxQueues += 1
+
+            elif queue.startswith('tx-'):
+                txQueues += 1
+    except:
+        pass
+
+    speed = __readInt(f'{path}/speed')
+
+    # speed is -1 (or unreadable) when the link is down or the driver does not report it
+    if speed is not None and speed < 0:
+        speed = None
+
+    master = None
+    try:
+        master = os.path.basename(os.readlink(f'{path}/master'))
+    except:
+        pass
+
+    return {
+        'macAddress' : __readFile(f'{path}/address').strip(),
+        'interfaceType' : interfaceType,
+        'index' : __readInt(f'{path}/ifindex'),
+        'speed' : speed,
+        'duplex' : __readFile(f'{path}/duplex').strip() or None,
+        'mtu' : __readInt(f'{path}/mtu'),
+        'operationalState' : __readFile(f'{path}/operstate').strip() or None,
+        'driver' : driver,
+        'master' : master,
+        'rxQueues' : rxQueues,
+        'txQueues' : txQueues
+    }
+
+def networkInterfaces(refresh=False):
     baseDirectory = '/sys/class/net'
     interfaces = []
 
-    for directory in os.listdir(baseDirectory):
-        name = directory
-        path = f'{baseDirectory}/{name}'
+    if refresh:
+        _invalidateInterfaces()
+
+    names = __listDirectory('net', baseDirectory)
 
-        with open(f'{path}/address', 'r') as file:
-            mac = file.read().strip()
+    for name in set(__interfaceCache) - set(names):
+        __interfaceCache.pop(name, None)
 
-        interfaceType = InterfaceType.VIRTUAL
-        directoryContent = os.listdir(path)
+    for name in names:
+        attributes = __interfaceCache.get(name)
 
-        if 'phydev' in directoryContent or 'phy80211' in directoryContent:
-             interfaceType = InterfaceType.PHYSICAL
+        if attributes is None:
+            generation = __interfaceGeneration
+            attributes = __interfaceAttributes(f'{baseDirectory}/{name}')
 
-        interfaces.append(NetowrkInterface(name=name, macAddress=mac, interfaceType=interfaceType))
+            # attributes read while a link changed may already be outdated
+            if __interfaceGeneration == generation:
+                __interfaceCache[name] = attributes
+
+        interfaces.append(NetowrkInterface(name=name, **attributes))
 
     return interfaces
 
+class SnapshotPublisher:
+    # the segment starts with a seqlock header (sequence number, payload length) followed by the JSON payload,
+    # the sequence number is odd while a snapshot is being written
+    HEADER = '=QQ'
+    HEADER_SIZE = 16
+
+    def __init__(self, name='sysutil', size=1 << 20, collectors=None):
+        from multiprocessing import shared_memory
+
+        self.name = name
+        self.__memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.__sequence = 0
+
+        self.__thread = None
+        self.__running = False
+
+        if collectors is None:
+            statSampler = StatSampler()
+
+            collectors = {
+                'cpu' : statSampler.update,
+                'memory' : lambda: memoryInfo(vmstat=True),
+                'load' : getLoad,
+                'pressure' : pressureInfo,
+                'network' : interfaceCounters,
+                'temperature-sensors' : temperatureSensors
+            }
+
+        self.collectors = collectors
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def __serialize(value):
+        if dataclasses.is_dataclass(value):
+            return dataclasses.asdict(value)
+
+        if isinstance(value, array.array):
+            return value.tolist()
+
+        raise TypeError(f'{type(value).__name__} is not serializable')
+
+    def snapshot(self):
+        snapshot = {'timestamp' : time.time()}
+
+        for name, collector in self.collectors.items():
+            try:
+                snapshot[name] = collector()
+            except:
+                snapshot[name] = None
+
+        return snapshot
+
+    def publish(self, snapshot=None):
+        import json
+        import struct
+
+        if snapshot is None:
+            snapshot = self.snapshot()
+
+        payload = json.dumps(snapshot, default=self.__serialize).encode()
+
+        if len(payload) > self.__memory.size - self.HEADER_SIZE:
+            raise ValueError(f'snapshot of {len(payload)} bytes does not fit in the shared memory segment')
+
+        buffer = self.__memory.buf
+
+        struct.pack_into('=Q', buffer, 0, self.__sequence + 1)
+        struct.pack_into('=Q', buffer, 8, len(payload))
+        buffer[self.HEADER_SIZE:self.HEADER_SIZE + len(payload)] = payload
+        struct.pack_into('=Q', buffer, 0, self.__sequence + 2)
+
+        self.__sequence += 2
+
+    def start(self, interval=1.0):
+        import threading
+
+        if self.__thread is not None:
+            return
+
+        self.__running = True
+        self.__thread = threading.Thread(target=self.__run, args=(interval,), name='sysutil-snapshot-publisher', daemon=True)
+        self.__thread.start()
+
+    def __run(self, interval):
+        while self.__running:
+            started = time.monotonic()
+            self.publish()
+
+            time.sleep(max(0, interval - (time.monotonic() - started)))
+
+    def stop(self):
+        self.__running = False
+
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def close(self, unlink=True):
+        self.stop()
+        self.__memory.close()
+
+        if unlink:
+            self.__memory.unlink()
+
+class SnapshotReader:
+    def __init__(self, name='sysutil'):
+        import mmap
+
+        self.name = name
+
+        # the segment is mapped directly rather than through SharedMemory, which would register it with
+        # the resource tracker of the reader and unlink it when the reader exits
+        fd = os.open(f'/dev/shm/{name.lstrip("/")}', os.O_RDONLY)
+
+        try:
+            self.__map = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+
+        self.sequence = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, retries=1000):
+        import json
+        import struct
+
+        buffer = self.__map
+        headerSize = SnapshotPublisher.HEADER_SIZE
+
+        for _ in range(retries):
+            before, length = struct.unpack_from(SnapshotPublisher.HEADER, buffer, 0)
+
+            if before == 0:
+                # nothing has been published yet
+                return None
+
+            if before % 2:
+                time.sleep(0)
+                continue
+
+            payload = bytes(buffer[headerSize:headerSize + length])
+
+            if struct.unpack_from('=Q', buffer, 0)[0] == before:
+                self.sequence = before
+                return json.loads(payload)
+
+        return None
+
+    def close(self):
+        self.__map.close()
+
+# collectors callable without arguments, the only names accepted by collect
+COLLECTORS = frozenset((
+    'powerSupplies', 'batteryInfo', 'gpuUsage', 'procStat', 'cpuUsage', 'vmstatInfo', 'memoryInfo', 'ramUsage',
+    'interfaceCounters', 'networkRate', 'temperatureSensors', 'cpuTopology', 'numaMemory', 'cpuInfo', 'ramSize',
+    'schedulerInfo', 'vramSize', 'vramUsage', 'networkRoutes', 'netStatistics', 'tcpStatistics', 'connectionSummary',
+    'clockSource', 'biosInfo', 'motherboardInfo', 'gpuMetrics', 'nvmeDevices', 'storageDevices', 'filesystemUsage',
+    'cpuFrequency', 'getBacklight', 'getLoad', 'pressureInfo', 'ipAddresses', 'getIPv4', 'busInput',
+    'networkInterfaces', 'exportJson'
+))
+
+def collect(fields):
+    import threading
+
+    global __snapshotState
+
+    # collector -> attributes requested from its result, '' standing for the whole result
+    plan = {}
+
+    for field in fields:
+        collector, _, attribute = field.partition('.')
+        if collector not in COLLECTORS:
+            raise ValueError(f'unknown collector: {collector}')
+
+        plan.setdefault(collector, []).append(attribute)
+
+    if __snapshotState is None:
+        __snapshotState = threading.local()
+
+    # a nested call shares the sources of the outer snapshot
+    previous = getattr(__snapshotState, 'sources', None)
+    __snapshotState.sources = {} if previous is None else previous
+
+    values = {}
+
+    try:
+        for collector, attributes in plan.items():
+            try:
+                result = globals()[collector]()
+            except Exception:
+                result = None
+
+            for attribute in attributes:
+                if not attribute:
+                    values[collector] = result
+                    continue
+
+                try:
+                    values[f'{collector}.{attribute}'] = operator.attrgetter(attribute)(result)
+                except AttributeError:
+                    if result is not None:
+                        raise ValueError(f'unknown field: {collector}.{attribute}')
+
+                    values[f'{collector}.{attribute}'] = None
+
+    finally:
+        __snapshotState.sources = previous
+
+    return values
+
+# upper bounds, in seconds, of the collectors latency histogram buckets
+INSTRUMENTATION_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float('inf'))
+
+__INSTRUMENTATION_API = (
+    'enableInstrumentation', 'disableInstrumentation', 'resetInstrumentation', 'instrumentationStats',
+    'addInstrumentationHook', 'removeInstrumentationHook', 'enableHotplugCache', 'disableHotplugCache',
+    'setCoalescingStaleness'
+)
+
+__instrumentedOriginals = {}
+__instrumentationStats = {}
+__instrumentationHooks = []
+__instrumentationState = {}
+
+class __CountingFile:
+    def __init__(self, file, collectors, lock):
+        self.__file = file
+        self.__collectors = collectors
+        self.__lock = lock
+
+    def __count(self, data):
+        with self.__lock:
+            for stats in self.__collectors:
+                stats.bytesRead += len(data)
+
+        return data
+
+    def __enter__(self):
+        self.__file.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        return self.__file.__exit__(*args)
+
+    def __iter__(self):
+        for line in self.__file:
+            yield self.__count(line)
+
+    def read(self, *args):
+        return self.__count(self.__file.read(*args))
+
+    def readline(self, *args):
+        return self.__count(self.__file.readline(*args))
+
+    def readlines(self, *args):
+        lines = self.__file.readlines(*args)
+
+        for line in lines:
+            self.__count(line)
+
+        return lines
+
+    def __getattr__(self, name):
+        return getattr(self.__file, name)
+
+def __activeCollectors():
+    local = __instrumentationState['local']
+
+    if not hasattr(local, 'stack'):
+        local.stack = []
+        local.exceptions = []
+
+    return local
+
+def __countingOpen(*args, **kwargs):
+    import builtins
+
+    file = builtins.open(*args, **kwargs)
+    active = __activeCollectors()
+
+    if not active.stack:
+        return file
+
+    collectors = list({id(stats) : stats for stats in active.stack}.values())
+    lock = __instrumentationState['lock']
+
+    with lock:
+        for stats in collectors:
+            stats.filesOpened += 1
+
+    return __CountingFile(file, collectors, lock)
+
+def __exceptionHandled(code, offset, exception):
+    if code.co_filename != __file__:
+        return
+
+    # handled is not swallowed yet: the exception may still propagate out of the collector
+    for seen in __activeCollectors().exceptions:
+        seen[id(exception)] = exception
+
+def __traceExceptions(frame, event, arg):
+    if event == 'exception':
+        for seen in __activeCollectors().exceptions:
+            seen[id(arg[1])] = arg[1]
+
+    return __traceExceptions
+
+def __chainTracers(ours, theirs):
+    # local trace function of a frame traced by both, each one keeping its own local trace function
+    def trace(frame, event, arg):
+        nonlocal ours, theirs
+
+        if ours is not None:
+            ours = ours(frame, event, arg)
+
+        if theirs is not None:
+            theirs = theirs(frame, event, arg)
+
+        return trace if ours is not None or theirs is not None else None
+
+    return trace
+
+def __tracer(previous):
+    # global trace function, chaining to the tracer which was active before (coverage, debugger)
+    def traceCalls(frame, event, arg):
+        theirs = previous(frame, event, arg) if previous is not None else None
+
+        # only frames of this module are traced line by line
+        if frame.f_globals is not globals() or not __activeCollectors().stack:
+            return theirs
+
+        if theirs is None:
+            return __traceExceptions
+
+        return __chainTracers(__traceExceptions, theirs)
+
+    return traceCalls
+
+def __newCollectorStats(name):
+    return CollectorStats(
+        name=name,
+        calls=0,
+        errors=0,
+        totalSeconds=0.0,
+        histogram=dict.fromkeys(INSTRUMENTATION_BUCKETS, 0),
+        filesOpened=0,
+        bytesRead=0,
+        exceptionsSwallowed=0
+    )
+
+def __instrument(name, function):
+    import functools
+
+    stats = __instrumentationStats.setdefault(name, __newCollectorStats(name))
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        active = __activeCollectors()
+        tracing = __instrumentationState.get('tracing', False)
+
+        active.stack.append(stats)
+        if tracing:
+            active.exceptions.append({})
+
+        tokens = [onStart(name) if onStart else None for onStart, _ in __instrumentationHooks]
+
+        started = time.perf_counter()
+        error = None
+
+        try:
+            return function(*args, **kwargs)
+
+        except BaseException as exception:
+            error = exception
+            raise
+
+        finally:
+            elapsed = time.perf_counter() - started
+            active.stack.pop()
+
+            with __instrumentationState['lock']:
+                stats.calls += 1
+                stats.totalSeconds += elapsed
+
+                if error is not None:
+                    stats.errors += 1
+
+                for bound in INSTRUMENTATION_BUCKETS:
+                    if elapsed <= bound:
+                        stats.histogram[bound] += 1
+                        break
+
+                if tracing and active.exceptions:
+                    seen = active.exceptions.pop()
+                    seen.pop(id(error), None)
+
+                    stats.exceptionsSwallowed += len(seen)
+
+            for (_, onEnd), token in zip(__instrumentationHooks, tokens):
+                if onEnd:
+                    onEnd(name, token, elapsed, error)
+
+    return wrapper
+
+def enableInstrumentation(traceExceptions=False):
+    import threading
+
+    if __instrumentedOriginals:
+        return
+
+    __instrumentationState['local'] = threading.local()
+    __instrumentationState['lock'] = threading.Lock()
+
+    moduleGlobals = globals()
+
+    for name, value in list(moduleGlobals.items()):
+        if name.startswith('_') or name in __INSTRUMENTATION_API:
+            continue
+
+        if not callable(value) or isinstance(value, type) or getattr(value, '__module__', None) != __name__:
+            continue
+
+        __instrumentedOriginals[name] = value
+        moduleGlobals[name] = __instrument(name, value)
+
+    # the module level `open` shadows the builtin one for every function of this module
+    moduleGlobals['open'] = __countingOpen
+
+    if traceExceptions:
+        if hasattr(sys, 'monitoring'):
+            # EXCEPTION_HANDLED reports exactly the exceptions caught by an except clause
+            for toolId in range(6):
+                if sys.monitoring.get_tool(toolId) is None:
+                    break
+            else:
+                raise RuntimeError('no sys.monitoring tool id available')
+
+            sys.monitoring.use_tool_id(toolId, 'sysutil')
+            sys.monitoring.register_callback(toolId, sys.monitoring.events.EXCEPTION_HANDLED, __exceptionHandled)
+            sys.monitoring.set_events(toolId, sys.monitoring.events.EXCEPTION_HANDLED)
+
+            __instrumentationState['monitoring'] = toolId
+            __instrumentationState['tracing'] = True
+
+        else:
+            # threading.gettrace is only available from Python 3.10
+            previous = (sys.gettrace(), getattr(threading, 'gettrace', lambda: threading._trace_hook)())
+
+            sys.settrace(__tracer(previous[0]))
+            threading.settrace(__tracer(previous[1]))
+
+            __instrumentationState['settrace'] = previous
+            __instrumentationState['tracing'] = True
+
+def disableInstrumentation():
+    import threading
+
+    moduleGlobals = globals()
+
+    for name, function in __instrumentedOriginals.items():
+        moduleGlobals[name] = function
+
+    __instrumentedOriginals.clear()
+    moduleGlobals.pop('open', None)
+
+    if (toolId := __instrumentationState.pop('monitoring', None)) is not None:
+        sys.monitoring.set_events(toolId, 0)
+        sys.monitoring.register_callback(toolId, sys.monitoring.events.EXCEPTION_HANDLED, None)
+        sys.monitoring.free_tool_id(toolId)
+
+    __instrumentationState.pop('tracing', None)
+
+    if (previous := __instrumentationState.pop('settrace', None)) is not None:
+        sys.settrace(previous[0])
+        threading.settrace(previous[1])
+
+def resetInstrumentation():
+    for name in list(__instrumentationStats):
+        stats = __instrumentationStats[name]
+        fresh = __newCollectorStats(name)
+
+        for field in dataclasses.fields(CollectorStats):
+            setattr(stats, field.name, getattr(fresh, field.name))
+
+def instrumentationStats():
+    return {
+        name : dataclasses.replace(stats, histogram=dict(stats.histogram))
+        for name, stats in __instrumentationStats.items() if stats.calls
+    }
+
+def addInstrumentationHook(onStart=None, onEnd=None):
+    hook = (onStart, onEnd)
+    __instrumentationHooks.append(hook)
+
+    return hook
+
+def removeInstrumentationHook(hook):
+    __instrumentationHooks.remove(hook)
+
 def exportJson():
     json = {}
 
@@ -1598,6 +5041,26 @@ def exportJson():
         'fifteen-minutes' : load.fifteenMinutes
     }
 
+    def pressureToJson(pressure: Pressure):
+        if pressure is None:
+            return None
+
+        return {
+            kind : {
+                'avg10' : record.avg10,
+                'avg60' : record.avg60,
+                'avg300' : record.avg300,
+                'total' : record.total
+            } if record else None for kind, record in (('some', pressure.some), ('full', pressure.full))
+        }
+
+    systemPressure = pressureInfo()
+    json['pressure'] = {
+        'cpu' : pressureToJson(systemPressure.cpu),
+        'memory' : pressureToJson(systemPressure.memory),
+        'io' : pressureToJson(systemPressure.io)
+    }
+
     ipv4Addresses = getIPv4()
     json['ipv4'] = [
         {
@@ -1639,41 +5102,269 @@ def exportJson():
 
     return json
 
-if __name__ == '__main__':
-    print(cpuUsage())
-    print(f'RAM usage:', ramUsage())
+# command line sections: name -> (collector, sampler); names are resolved at call time
+__CLI_SECTIONS = {
+    'cpu' : ('cpuUsage', 'StatSampler'),
+    'frequency' : ('cpuFrequency', 'FrequencySampler'),
+    'cpuinfo' : ('cpuInfo', None),
+    'topology' : ('cpuTopology', None),
+    'scheduler' : ('schedulerInfo', None),
+    'load' : ('getLoad', None),
+    'pressure' : ('pressureInfo', 'PressureSampler'),
+    'memory' : ('memoryInfo', None),
+    'vmstat' : ('vmstatInfo', 'VmStatSampler'),
+    'numa' : ('numaMemory', None),
+    'interrupts' : (None, 'InterruptSampler'),
+    'network' : ('networkRate', 'NetworkRateSampler'),
+    'counters' : ('interfaceCounters', None),
+    'interfaces' : ('networkInterfaces', None),
+    'addresses' : ('ipAddresses', None),
+    'routes' : ('networkRoutes', None),
+    'connections' : ('connectionSummary', None),
+    'tcp' : ('tcpStatistics', 'TcpStatisticsSampler'),
+    'temperature' : ('temperatureSensors', None),
+    'thermal' : (None, 'ThermalSampler'),
+    'power' : (None, 'PowerSampler'),
+    'battery' : ('batteryInfo', None),
+    'supplies' : ('powerSupplies', 'PowerSupplySampler'),
+    'backlight' : ('getBacklight', None),
+    'gpu' : ('gpuMetrics', None),
+    'storage' : ('storageDevices', None),
+    'nvme' : ('nvmeDevices', None),
+    'filesystems' : ('filesystemUsage', None),
+    'clock' : ('clockSource', None),
+    'bios' : ('biosInfo', None),
+    'motherboard' : ('motherboardInfo', None)
+}
+
+def __plain(value):
+    if isinstance(value, ByteSize):
+        return value.b()
+
+    if isinstance(value, Frequency):
+        return value.khz()
+
+    if isinstance(value, InterruptRates):
+        return {label : value.total(label) for label in value.labels}
+
+    if dataclasses.is_dataclass(value):
+        return {field.name : __plain(getattr(value, field.name)) for field in dataclasses.fields(value)}
+
+    if isinstance(value, dict):
+        return {str(key) : __plain(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple, array.array)):
+        return [__plain(item) for item in value]
+
+    return value
+
+def __flatten(value, path=(), labels=()):
+    # record fields extend the metric path, mapping keys and sequence indexes become labels
+    if isinstance(value, (ByteSize, Frequency, InterruptRates, array.array)):
+        value = __plain(value)
+
+    if dataclasses.is_dataclass(value):
+        for field in dataclasses.fields(value):
+            yield from __flatten(getattr(value, field.name), path + (field.name,), labels)
+
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from __flatten(item, path, labels + ((path[-1] if path else 'key', str(key)),))
+
+    elif isinstance(value, (list, tuple)):
+        for index, item in enumerate(value):
+            yield from __flatten(item, path, labels + ((path[-1] if path else 'index', str(index)),))
+
+    else:
+        yield path, labels, value
+
+def __renderText(sections, errors):
+    lines = []
+
+    for section, value in sections.items():
+        lines.append(f'[{section}]')
+
+        if value is None:
+            lines.append(f'unavailable: {errors[section]}' if section in errors else 'unavailable')
+
+        for path, labels, item in __flatten(value):
+            if value is None:
+                break
+
+            if isinstance(item, float):
+                item = round(item, 2)
+
+            key = '.'.join(path) or section
+            if labels:
+                key += '[' + ', '.join(label for _, label in labels) + ']'
+
+            lines.append(f'{key:<48} {item}')
+
+        lines.append('')
+
+    return '\n'.join(lines)
+
+def __renderPrometheus(sections):
+    import re
+
+    lines = []
+
+    for section, value in sections.items():
+        for path, labels, item in __flatten(value):
+            if isinstance(item, bool):
+                item = int(item)
+
+            if not isinstance(item, (int, float)):
+                continue
+
+            name = '_'.join(('sysutil', section) + path)
+            name = re.sub('[^a-zA-Z0-9_]', '_', re.sub('([a-z0-9])([A-Z])', r'\1_\2', name)).lower()
+
+            if labels:
+                seen = {}
+
+                for label, _ in labels:
+                    seen[label] = seen.get(label, 0) + 1
+
+                rendered = []
+                for index, (label, labelValue) in enumerate(labels):
+                    label = re.sub('[^a-zA-Z0-9_]', '_', re.sub('([a-z0-9])([A-Z])', r'\1_\2', label)).lower()
+                    labelValue = labelValue.replace('\\', '\\\\').replace('"', '\\"')
+
+                    rendered.append(f'{label}{index if seen[labels[index][0]] > 1 else ""}="{labelValue}"')
+
+                name += '{' + ','.join(rendered) + '}'
+
+            lines.append(f'{name} {item}')
 
-    print(networkRate())
-    print(f'GPU usage:', gpuUsage())
+    return '\n'.join(lines) + '\n'
 
-    print(temperatureSensors())
-    print(cpuInfo())
+def __renderFrame(sections, output, errors=None):
+    import json
 
-    print(ramSize())
-    print(schedulerInfo())
+    if output == 'json':
+        return json.dumps({name : __plain(value) for name, value in sections.items()}) + '\n'
 
-    print(batteryInfo())
-    print(vramSize())
+    if output == 'prom':
+        return __renderPrometheus(sections)
 
-    print('VRAM usage:', vramUsage())
-    print(networkRoutes())
+    return __renderText(sections, errors or {}) + '\n'
 
-    print(CPU())
-    print(cpuFrequency())
+def __collectSections(names, samplers, errors):
+    sections = {}
 
-    print(clockSource())
-    print(motherboardInfo())
+    for name in names:
+        collector, _ = __CLI_SECTIONS[name]
 
-    print(gpuMetrics())
-    print(storageDevices())
+        try:
+            if name in samplers:
+                value = samplers[name].update()
+            else:
+                value = globals()[collector]()
+
+            sections[name] = value
+
+        except Exception as exception:
+            # keyed by section, so a section failing on every refresh is kept once
+            errors[name] = exception
+            sections[name] = None
+
+    return sections
+
+def main(argv=None):
+    import argparse
+
+    formats = argparse.ArgumentParser(add_help=False)
+    group = formats.add_mutually_exclusive_group()
+    group.add_argument('--json', dest='output', action='store_const', const='json', help='print JSON')
+    group.add_argument('--prom', dest='output', action='store_const', const='prom', help='print Prometheus text format')
+
+    parser = argparse.ArgumentParser(prog='sysutil', description='Linux system information')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    for name, (collector, sampler) in __CLI_SECTIONS.items():
+        command = commands.add_parser(name, parents=[formats], help=f'show {name} information')
+
+        if collector is None:
+            command.add_argument('-n', '--interval', type=float, default=1.0, help='sampling interval in seconds')
+
+    watch = commands.add_parser('watch', parents=[formats], help='refresh sections periodically')
+    watch.add_argument('sections', nargs='+', choices=list(__CLI_SECTIONS), metavar='section')
+    watch.add_argument('-n', '--interval', type=float, default=1.0, help='refresh interval in seconds')
+    watch.add_argument('-c', '--count', type=int, default=None, help='exit after this many refreshes')
+
+    arguments = parser.parse_args(argv)
+    errors = {}
+
+    if arguments.command != 'watch':
+        samplers = {}
+
+        if __CLI_SECTIONS[arguments.command][0] is None:
+            samplers[arguments.command] = globals()[__CLI_SECTIONS[arguments.command][1]]()
+            time.sleep(arguments.interval)
+
+        sections = __collectSections((arguments.command,), samplers, errors)
+        sys.stdout.write(__renderFrame(sections, arguments.output))
+
+        for name, error in errors.items():
+            print(f'{name}: {error}', file=sys.stderr)
+
+        return 1 if errors else 0
 
-    print(nvmeDevices())
-    print(getBacklight())
+    names = tuple(dict.fromkeys(arguments.sections))
+    samplers = {}
 
-    print(getLoad())
-    print(getIPv4())
+    for name in names:
+        sampler = __CLI_SECTIONS[name][1]
 
-    print(networkInterfaces())
+        if sampler is not None:
+            try:
+                samplers[name] = globals()[sampler]()
+            except Exception as exception:
+                errors[name] = exception
+
+    redraw = arguments.output is None and sys.stdout.isatty()
+    deadline = time.monotonic()
+
+    # sampled sections need a full interval before their first value
+    if samplers:
+        deadline += arguments.interval
+
+    refreshes = 0
+
+    try:
+        while arguments.count is None or refreshes < arguments.count:
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            # errors of this refresh are shown in the frame, every error is reported on exit
+            current = {}
+            frame = __renderFrame(__collectSections(names, samplers, current), arguments.output, current)
+            errors.update(current)
+
+            if redraw:
+                # move to the top left corner and clear the screen in the same write
+                frame = '\x1b[H\x1b[J' + frame
 
-    print(busInput())
-    print(exportJson())
+            sys.stdout.write(frame)
+            sys.stdout.flush()
+
+            refreshes += 1
+            deadline = max(deadline + arguments.interval, time.monotonic())
+
+    except KeyboardInterrupt:
+        pass
+
+    except BrokenPipeError:
+        # the reader went away (`| head`), output flushed at exit must not raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+    for name, error in errors.items():
+        print(f'{name}: {error}', file=sys.stderr)
+
+    return 1 if errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())